@@ -0,0 +1 @@
+"""GitHub stats API: the FastAPI app is app.main:app."""
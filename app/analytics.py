@@ -0,0 +1,163 @@
+from array import array
+from datetime import date
+from itertools import groupby
+from operator import itemgetter
+
+# NumPy is optional; without it the same passes run over the typed array in
+# pure Python. Importing it takes ~100ms, so it is loaded on the first summary
+# instead of on every cold start.
+_NOT_LOADED = object()
+np = _NOT_LOADED
+
+def _numpy():
+    """Return the numpy module, importing it on first use, or None if it is not installed."""
+    global np
+    if np is _NOT_LOADED:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None
+    return np
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+PERCENTILES = (50, 75, 90, 99)
+
+def to_counts(contribution_days: list) -> array:
+    """Pack daily counts into a compact int32 array (one slot per consecutive day)."""
+    return array("i", map(itemgetter("count"), contribution_days))
+
+def _runs_numpy(active):
+    """Lengths of the runs of True in a boolean vector."""
+    edges = np.diff(np.concatenate(([0], active.view(np.int8), [0])))
+    return np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+
+def _summarize_numpy(counts: array, first_weekday: int) -> dict:
+    values = np.frombuffer(counts, dtype=np.int32)
+    active = values > 0
+    streaks = _runs_numpy(active)
+    gaps = _runs_numpy(~active)
+
+    # Trailing run of active days; an empty today does not break the streak yet
+    trailing = values[:-1] if values[-1] == 0 else values
+    zeros = np.flatnonzero(trailing == 0)
+    current_streak = len(trailing) - (zeros[-1] + 1 if len(zeros) else 0)
+
+    cumulative = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+    weekdays = (first_weekday + np.arange(len(values))) % 7
+    by_weekday = np.bincount(weekdays, weights=values, minlength=7)
+
+    # One sort, then linear interpolation (np.percentile's default) for all percentiles at once
+    ordered = np.sort(values)
+    positions = (len(ordered) - 1) * np.array(PERCENTILES) / 100
+    lower = positions.astype(np.int64)
+    upper = np.minimum(lower + 1, len(ordered) - 1)
+    percentiles = ordered[lower] + (ordered[upper] - ordered[lower]) * (positions - lower)
+
+    return {
+        "total": int(cumulative[-1]),
+        "active_days": int(np.count_nonzero(active)),
+        "max_streak": int(streaks.max()) if len(streaks) else 0,
+        "current_streak": int(current_streak),
+        "longest_gap": int(gaps.max()) if len(gaps) else 0,
+        "average_7d": round(float(cumulative[-1] - cumulative[-min(7, len(values)) - 1]) / min(7, len(values)), 2),
+        "average_30d": round(float(cumulative[-1] - cumulative[-min(30, len(values)) - 1]) / min(30, len(values)), 2),
+        "weekday_distribution": {day: int(total) for day, total in zip(WEEKDAYS, by_weekday)},
+        "percentiles": {
+            f"p{p}": round(float(value), 2)
+            for p, value in zip(PERCENTILES, percentiles)
+        }
+    }
+
+def _percentile(ordered: list, p: float) -> float:
+    """Linear-interpolated percentile, matching numpy's default method."""
+    position = (len(ordered) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def _summarize_python(counts: array, first_weekday: int) -> dict:
+    runs = [(is_active, sum(1 for _ in group)) for is_active, group in groupby(counts, key=bool)]
+    streaks = [length for is_active, length in runs if is_active]
+    gaps = [length for is_active, length in runs if not is_active]
+
+    # Trailing run of active days; an empty today does not break the streak yet
+    trailing = runs[:-1] if len(runs) > 1 and counts[-1] == 0 and runs[-1][1] == 1 else runs
+    current_streak = trailing[-1][1] if trailing and trailing[-1][0] else 0
+
+    last_7 = counts[-7:]
+    last_30 = counts[-30:]
+    by_weekday = [0] * 7
+    for offset in range(7):
+        by_weekday[(first_weekday + offset) % 7] = sum(counts[offset::7])
+    ordered = sorted(counts)
+
+    return {
+        "total": sum(counts),
+        "active_days": sum(streaks),
+        "max_streak": max(streaks, default=0),
+        "current_streak": current_streak,
+        "longest_gap": max(gaps, default=0),
+        "average_7d": round(sum(last_7) / len(last_7), 2),
+        "average_30d": round(sum(last_30) / len(last_30), 2),
+        "weekday_distribution": dict(zip(WEEKDAYS, by_weekday)),
+        "percentiles": {f"p{p}": round(float(_percentile(ordered, p)), 2) for p in PERCENTILES}
+    }
+
+def summarize_counts(counts: array, first_weekday: int) -> dict:
+    """Summarize packed daily counts whose first day falls on `first_weekday` (Monday is 0)."""
+    if not counts:
+        return {
+            "total": 0,
+            "active_days": 0,
+            "max_streak": 0,
+            "current_streak": 0,
+            "longest_gap": 0,
+            "average_7d": 0.0,
+            "average_30d": 0.0,
+            "weekday_distribution": dict.fromkeys(WEEKDAYS, 0),
+            "percentiles": {f"p{p}": 0.0 for p in PERCENTILES}
+        }
+
+    if _numpy() is not None:
+        return _summarize_numpy(counts, first_weekday)
+    return _summarize_python(counts, first_weekday)
+
+def summarize(contribution_days: list) -> dict:
+    """Compute streak, gap, rolling-average, weekday and percentile stats over consecutive days."""
+    if not contribution_days:
+        return summarize_counts(array("i"), 0)
+    first_weekday = date.fromisoformat(contribution_days[0]["date"]).weekday()
+    return summarize_counts(to_counts(contribution_days), first_weekday)
+
+def consecutive_runs(contribution_days: list) -> list:
+    """Split date-ordered days into lists of consecutive dates (e.g. around a year that was never stored)."""
+    runs = []
+    previous = None
+    for day in contribution_days:
+        ordinal = date.fromisoformat(day["date"]).toordinal()
+        if previous is None or ordinal != previous + 1:
+            runs.append([])
+        runs[-1].append(day)
+        previous = ordinal
+    return runs
+
+def summarize_runs(contribution_days: list) -> dict:
+    """summarize() for days with missing stretches: each run is summarized on its own and the results merged.
+
+    Nothing is counted across a missing stretch, so it is neither a gap nor a
+    break in a streak. Averages and percentiles are those of the latest run.
+    """
+    runs = consecutive_runs(contribution_days)
+    if len(runs) <= 1:
+        return summarize(contribution_days)
+    summaries = [summarize(run) for run in runs]
+    merged = dict(summaries[-1])
+    merged["total"] = sum(summary["total"] for summary in summaries)
+    merged["active_days"] = sum(summary["active_days"] for summary in summaries)
+    merged["max_streak"] = max(summary["max_streak"] for summary in summaries)
+    merged["longest_gap"] = max(summary["longest_gap"] for summary in summaries)
+    merged["weekday_distribution"] = {
+        day: sum(summary["weekday_distribution"][day] for summary in summaries) for day in WEEKDAYS
+    }
+    return merged
@@ -0,0 +1,133 @@
+import asyncio
+import os
+from .http_client import get_client
+from . import graphql
+from .tokens import token_pool
+
+# Largest accepted batch, users fetched at once, and profiles joined into one GraphQL query
+BATCH_MAX_USERS = int(os.getenv("BATCH_MAX_USERS", "500"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "10"))
+BATCH_PROFILES_PER_QUERY = int(os.getenv("BATCH_PROFILES_PER_QUERY", "50"))
+
+_limiter = None
+
+def batch_limiter() -> asyncio.Semaphore:
+    """The BATCH_CONCURRENCY slots shared by every batch in the process.
+
+    Concurrent batches (and org aggregates) take upstream fetches from this
+    one budget instead of each getting their own. Created on first use so it
+    binds to the running event loop.
+    """
+    global _limiter
+    if _limiter is None:
+        _limiter = asyncio.Semaphore(BATCH_CONCURRENCY)
+    return _limiter
+
+def unique_usernames(usernames) -> list:
+    """Drop blanks and case-insensitive duplicates, keeping the first spelling and order."""
+    seen = set()
+    unique = []
+    for username in usernames:
+        username = username.strip()
+        if username and username.lower() not in seen:
+            seen.add(username.lower())
+            unique.append(username)
+    return unique
+
+def _profile_loader(usernames: list, client=None):
+    """Return `profiles_for(username)`, reading profiles in aliased GraphQL chunks.
+
+    Each chunk of BATCH_PROFILES_PER_QUERY users is queried once, when the
+    first of its users is needed, so early results never wait on the whole
+    batch. `profiles_for` returns the chunk's {username: profile or None if
+    the user does not exist}, or {} if the user is not covered (no token,
+    or the query failed) and must be fetched over REST as usual.
+    """
+    chunks = [usernames[i:i + BATCH_PROFILES_PER_QUERY] for i in range(0, len(usernames), BATCH_PROFILES_PER_QUERY)]
+    chunk_of = {username: index for index, chunk in enumerate(chunks) for username in chunk}
+    tasks = {}
+
+    async def fetch_chunk(chunk):
+        async with batch_limiter():
+            return await graphql.fetch_profiles(client or get_client(), chunk, {})
+
+    async def profiles_for(username):
+        # GraphQL needs a token
+        if username not in chunk_of or not token_pool.has_tokens():
+            return {}
+        index = chunk_of[username]
+        if index not in tasks:
+            tasks[index] = asyncio.ensure_future(fetch_chunk(chunks[index]))
+        try:
+            # Several users wait on one chunk; a cancelled waiter must not cancel it
+            return await asyncio.shield(tasks[index]) or {}
+        except Exception:
+            return {}
+
+    def close():
+        for task in tasks.values():
+            task.cancel()
+
+    return profiles_for, close
+
+async def iter_batch_stats(usernames: list, load, is_cached, concurrency: int = None):
+    """Yield one result per distinct username as each completes.
+
+    `load(username, profile)` returns a user's stats (or None if not found)
+    and `is_cached(username)` tells whether they can be served without
+    fetching; only the others get their profiles prefetched. A failing user
+    yields an "error" entry instead of ending the batch.
+
+    At most `concurrency` users are in flight, and no new fetch starts while
+    the consumer is still handling a result, so a slow reader throttles the
+    upstream calls instead of piling up finished results in memory. Users
+    that need fetching also wait for a slot in the process-wide
+    batch_limiter(), so concurrent batches share BATCH_CONCURRENCY.
+    """
+    concurrency = concurrency or BATCH_CONCURRENCY
+    usernames = unique_usernames(usernames)
+    uncached = {username for username in usernames if not is_cached(username)}
+    profiles_for, close_profiles = _profile_loader([username for username in usernames if username in uncached])
+
+    async def fetch_one(username):
+        # Profiles are read before taking a slot: their chunk query takes one too
+        profiles = await profiles_for(username)
+        if username in profiles and profiles[username] is None:
+            return {"username": username, "error": "User not found"}
+        try:
+            if username in uncached:
+                async with batch_limiter():
+                    stats = await load(username, profiles.get(username))
+            else:
+                stats = await load(username, profiles.get(username))
+        except Exception:
+            return {"username": username, "error": "Failed to fetch stats"}
+        if stats is None:
+            return {"username": username, "error": "User not found"}
+        return {"username": username, "stats": stats}
+
+    remaining = iter(usernames)
+    pending = set()
+    try:
+        while True:
+            for username in remaining:
+                pending.add(asyncio.ensure_future(fetch_one(username)))
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        # The client went away: stop waiting on results nobody will read
+        for task in pending:
+            task.cancel()
+        close_profiles()
+
+async def get_batch_stats(usernames: list, load, is_cached, concurrency: int = None) -> list:
+    """Collect iter_batch_stats into a list in request order."""
+    results = {}
+    async for result in iter_batch_stats(usernames, load, is_cached, concurrency):
+        results[result["username"]] = result
+    return [results[username] for username in unique_usernames(usernames)]
@@ -0,0 +1,213 @@
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+
+# Stats are fresh for STATS_CACHE_TTL seconds, then served stale (while a
+# background refresh runs) until STATS_CACHE_STALE_TTL seconds old
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "300"))
+STATS_CACHE_STALE_TTL = float(os.getenv("STATS_CACHE_STALE_TTL", "3600"))
+STATS_CACHE_MAX_ENTRIES = int(os.getenv("STATS_CACHE_MAX_ENTRIES", "1000"))
+STATS_CACHE_MAX_BYTES = int(os.getenv("STATS_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Rendered cards are keyed by a hash of their content, so entries never go
+# stale; the TTL and bounds only limit memory
+CARD_CACHE_TTL = float(os.getenv("CARD_CACHE_TTL", "86400"))
+CARD_CACHE_MAX_ENTRIES = int(os.getenv("CARD_CACHE_MAX_ENTRIES", "1000"))
+CARD_CACHE_MAX_BYTES = int(os.getenv("CARD_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Cache-Control for rendered cards: browsers revalidate with the ETag while
+# shared caches (Vercel's edge, GitHub's camo) keep serving their copy
+CARD_MAX_AGE = int(os.getenv("CARD_MAX_AGE", "0"))
+CARD_S_MAXAGE = int(os.getenv("CARD_S_MAXAGE", "300"))
+CARD_STALE_WHILE_REVALIDATE = int(os.getenv("CARD_STALE_WHILE_REVALIDATE", "3600"))
+CARD_CACHE_CONTROL = (
+    f"public, max-age={CARD_MAX_AGE}, s-maxage={CARD_S_MAXAGE}, "
+    f"stale-while-revalidate={CARD_STALE_WHILE_REVALIDATE}"
+)
+# Partial cards (cut short by the deadline) must not be kept by shared caches
+# while the complete one is being fetched
+PARTIAL_CARD_CACHE_CONTROL = "no-store"
+
+def _sizeof(value) -> int:
+    """Approximate the memory held by a cached value via its JSON size."""
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    if isinstance(value, dict) and value and all(isinstance(item, bytes) for item in value.values()):
+        # Encoded variants of one body, e.g. a rendered card
+        return sum(len(item) for item in value.values())
+    return len(json.dumps(value, default=str))
+
+class TTLCache:
+    """LRU cache bounded by entry count and total bytes, with per-entry age."""
+
+    def __init__(self, ttl: float, stale_ttl: float, max_entries: int, max_bytes: int):
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, stored_at, size)
+        self._bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return (value, is_fresh), or None if the key is missing or too old."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, stored_at, _ = entry
+        age = time.monotonic() - stored_at
+        if age > self.stale_ttl:
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if age > self.ttl:
+            self.stale_hits += 1
+            return value, False
+        self.hits += 1
+        return value, True
+
+    def __contains__(self, key) -> bool:
+        """Whether key would be served from the cache (fresh or stale), without counting a lookup."""
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() - entry[1] <= self.stale_ttl
+
+    def set(self, key, value):
+        """Store a value, evicting least recently used entries over the limits.
+
+        A value larger than max_bytes is not stored, though it still drops
+        the older value under the same key.
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            # Storing it would only flush everything else
+            return
+        self._entries[key] = (value, time.monotonic(), size)
+        self._bytes += size
+
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def stats(self) -> dict:
+        """Report cache counters and occupancy."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0
+        }
+
+class SingleFlight:
+    """Deduplicate concurrent calls for the same key onto one in-flight task."""
+
+    def __init__(self):
+        self._in_flight = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def in_flight(self, key) -> bool:
+        return key in self._in_flight
+
+    def start(self, key, fetch) -> asyncio.Future:
+        """Return the running task for key, starting `fetch()` if there is none."""
+        task = self._in_flight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fetch())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return task
+
+    async def do(self, key, fetch):
+        """Await `fetch()` for key, joining a call that is already running."""
+        # A waiter that disconnects must not cancel the fetch the others share
+        return await asyncio.shield(self.start(key, fetch))
+
+    def _forget(self, key, task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight)
+        }
+
+class StaleWhileRevalidateCache(TTLCache):
+    """TTLCache that serves stale entries at once and refreshes them in the background.
+
+    Misses and refreshes for the same key are coalesced into a single fetch.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flights = SingleFlight()
+        self.refreshes = 0
+
+    def _loader(self, key, fetch):
+        async def load():
+            value = await fetch()
+            # Missing users are not cached so a newly created account shows up at once
+            if value is not None:
+                self.set(key, value)
+            return value
+        return load
+
+    async def get_or_fetch(self, key, fetch):
+        """Return the cached value for key, calling `await fetch()` on a miss."""
+        cached = self.get(key)
+        if cached is None:
+            return await self.flights.do(key, self._loader(key, fetch))
+
+        value, is_fresh = cached
+        if not is_fresh:
+            self.refresh(key, fetch)
+        return value
+
+    def refresh(self, key, fetch):
+        """Replace key's value with `await fetch()` in the background, unless a fetch is already running."""
+        if not self.flights.in_flight(key):
+            self.refreshes += 1
+            self.flights.start(key, self._loader(key, fetch))
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["refreshes"] = self.refreshes
+        stats["single_flight"] = self.flights.stats()
+        return stats
+
+# Computed user stats, shared by the JSON and SVG endpoints
+stats_cache = StaleWhileRevalidateCache(
+    STATS_CACHE_TTL, STATS_CACHE_STALE_TTL, STATS_CACHE_MAX_ENTRIES, STATS_CACHE_MAX_BYTES
+)
+
+# Rendered SVG cards keyed by content hash
+card_cache = TTLCache(CARD_CACHE_TTL, CARD_CACHE_TTL, CARD_CACHE_MAX_ENTRIES, CARD_CACHE_MAX_BYTES)
@@ -0,0 +1,54 @@
+import gzip
+
+# Brotli is optional; without it cards are precompressed with gzip only
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Encodings cards are stored in besides identity, preferred first when a
+# client accepts several equally
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+def compress(body: bytes) -> dict:
+    """Return {encoding: bytes} for the identity body and every available compressed variant.
+
+    Variants are built once per cached body, so the slowest, smallest
+    settings are used.
+    """
+    variants = {
+        "identity": body,
+        # mtime=0 keeps the output (and so its ETag) identical across renders
+        "gzip": gzip.compress(body, compresslevel=9, mtime=0)
+    }
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    return variants
+
+def _accepted(accept_encoding: str) -> dict:
+    """Parse an Accept-Encoding header into {coding: q}."""
+    accepted = {}
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+def negotiate(accept_encoding: str) -> str:
+    """Pick the best stored encoding for an Accept-Encoding header, falling back to identity."""
+    accepted = _accepted(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = "identity", 0.0
+    for encoding in ENCODINGS:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
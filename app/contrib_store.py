@@ -0,0 +1,83 @@
+import os
+import sqlite3
+import tempfile
+
+# Serverless platforms only allow writes under the temp dir; use ":memory:" to disable persistence
+CONTRIB_DB_PATH = os.getenv(
+    "CONTRIB_DB_PATH", os.path.join(tempfile.gettempdir(), "github-stats-contributions.sqlite3")
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contributions (
+    username TEXT NOT NULL,
+    date TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (username, date)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS closed_years (
+    username TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    PRIMARY KEY (username, year)
+) WITHOUT ROWID;
+"""
+
+class ContributionStore:
+    """SQLite table of daily contribution counts keyed by (username, date).
+
+    Dates are ISO strings, so they sort and compare as text.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # Only the event loop thread touches the connection
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+
+    def last_date(self, username: str):
+        """Return the latest stored date for username, or None if nothing is stored."""
+        row = self._db.execute(
+            "SELECT MAX(date) FROM contributions WHERE username = ?", (username,)
+        ).fetchone()
+        return row[0]
+
+    def save(self, username: str, days: list):
+        """Insert or overwrite daily counts ({"date", "count"} dicts)."""
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO contributions (username, date, count) VALUES (?, ?, ?)",
+                [(username, day["date"], day["count"]) for day in days]
+            )
+
+    def days(self, username: str, since: str, until: str = "9999-12-31") -> list:
+        """Return stored days in [since, until] in date order."""
+        rows = self._db.execute(
+            "SELECT date, count FROM contributions WHERE username = ? AND date >= ? AND date <= ? ORDER BY date",
+            (username, since, until)
+        ).fetchall()
+        return [{"date": date, "count": count} for date, count in rows]
+
+    def closed_years(self, username: str) -> set:
+        """Years whose calendars are fully stored and can no longer change."""
+        rows = self._db.execute("SELECT year FROM closed_years WHERE username = ?", (username,)).fetchall()
+        return {row[0] for row in rows}
+
+    def close_year(self, username: str, year: int):
+        with self._db:
+            self._db.execute("INSERT OR IGNORE INTO closed_years (username, year) VALUES (?, ?)", (username, year))
+
+    def stats(self) -> dict:
+        users, days = self._db.execute(
+            "SELECT COUNT(DISTINCT username), COUNT(*) FROM contributions"
+        ).fetchone()
+        return {"path": self.path, "users": users, "days": days}
+
+def _open_store() -> ContributionStore:
+    try:
+        return ContributionStore(CONTRIB_DB_PATH)
+    except sqlite3.Error:
+        # Read-only or broken file: keep working without persistence
+        return ContributionStore(":memory:")
+
+# Contribution calendars, shared by all requests
+contrib_store = _open_store()
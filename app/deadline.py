@@ -0,0 +1,76 @@
+import os
+import time
+import httpx
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Overall budget for building one user's stats, kept under the hosting
+# platform's function time limit (10s on Vercel's hobby plan)
+STATS_DEADLINE = float(os.getenv("STATS_DEADLINE", "8.0"))
+
+# Phases in order of value: a phase only starts new upstream calls while more
+# than its reserve is left, so languages are dropped first, then contributions,
+# and the profile is always fetched
+PHASE_RESERVES = {
+    "user": 0.0,
+    "contributions": float(os.getenv("STATS_DEADLINE_RESERVE_CONTRIBUTIONS", "1.0")),
+    "languages": float(os.getenv("STATS_DEADLINE_RESERVE_LANGUAGES", "2.0")),
+}
+
+_deadline = ContextVar("deadline", default=None)
+
+class Deadline:
+    """Time left for one stats fetch, and the phases it had to cut short."""
+
+    def __init__(self, seconds: float):
+        self.expires = time.monotonic() + seconds
+        self.skipped = set()
+
+    def remaining(self) -> float:
+        return self.expires - time.monotonic()
+
+    def allows(self, phase: str) -> bool:
+        """Whether `phase` may start another upstream call; if not, it is recorded as skipped."""
+        if self.remaining() > PHASE_RESERVES[phase]:
+            return True
+        self.skipped.add(phase)
+        return False
+
+def current():
+    """The deadline of the fetch being run, or None if it has none."""
+    return _deadline.get()
+
+def allows(phase: str) -> bool:
+    deadline = _deadline.get()
+    return deadline is None or deadline.allows(phase)
+
+def skip(phase: str):
+    """Record that `phase` ran out of time (e.g. a call timed out against the deadline)."""
+    deadline = _deadline.get()
+    if deadline is not None:
+        deadline.skipped.add(phase)
+
+@contextmanager
+def limit(seconds: float = None):
+    """Run a block under a deadline of `seconds` (None for none), shared by the tasks it starts."""
+    token = _deadline.set(Deadline(seconds) if seconds else None)
+    try:
+        yield _deadline.get()
+    finally:
+        _deadline.reset(token)
+
+def clamp_timeouts(request):
+    """Cap an upstream request's timeouts at the time left before the deadline.
+
+    Raises httpx.TimeoutException without sending once the deadline has passed.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise httpx.TimeoutException("Stats deadline exceeded", request=request)
+    timeouts = request.extensions.get("timeout") or {}
+    request.extensions["timeout"] = {
+        name: remaining if value is None else min(value, remaining) for name, value in timeouts.items()
+    }
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+import httpx
+
+# Set GITHUB_ETAG_STORE_PATH to a directory to keep validators across restarts
+ETAG_STORE_PATH = os.getenv("GITHUB_ETAG_STORE_PATH")
+ETAG_STORE_MAX_ENTRIES = int(os.getenv("GITHUB_ETAG_STORE_MAX_ENTRIES", "10000"))
+# Each record holds a whole response body (a 100-repo page is hundreds of KB)
+ETAG_STORE_MAX_BYTES = int(os.getenv("GITHUB_ETAG_STORE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+def _sizeof(record: dict) -> int:
+    """Approximate the memory held by a record; the body dominates."""
+    return sum(len(value) for value in record.values() if value)
+
+class MemoryBackend:
+    """LRU dict of url -> stored response record, bounded by entry count and total bytes."""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._records = OrderedDict()  # url -> (record, size)
+        self._bytes = 0
+        self.evictions = 0
+
+    def get(self, url: str):
+        entry = self._records.get(url)
+        if entry is None:
+            return None
+        self._records.move_to_end(url)
+        return entry[0]
+
+    def set(self, url: str, record: dict):
+        if url in self._records:
+            self._bytes -= self._records.pop(url)[1]
+        size = _sizeof(record)
+        if size > self.max_bytes:
+            # Storing it would only flush everything else
+            return
+        self._records[url] = (record, size)
+        self._bytes += size
+        while self._records and (len(self._records) > self.max_entries or self._bytes > self.max_bytes):
+            oldest, (_, oldest_size) = self._records.popitem(last=False)
+            self._bytes -= oldest_size
+            self.evictions += 1
+            self._evicted(oldest)
+
+    def _evicted(self, url: str):
+        """Called after url is dropped to stay within the limits."""
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+class DiskBackend(MemoryBackend):
+    """MemoryBackend that also writes records to one JSON file per URL.
+
+    Files are deleted when their record is evicted, and files left over from
+    earlier runs are pruned to the same limits on startup, newest kept.
+    """
+
+    def __init__(self, path: str, max_entries: int, max_bytes: int):
+        super().__init__(max_entries, max_bytes)
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._prune()
+
+    def _file(self, url: str) -> str:
+        return os.path.join(self.path, hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def _prune(self):
+        files = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith((".json", ".tmp")):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        files.sort(reverse=True)
+        kept = 0
+        kept_bytes = 0
+        for _, size, file in files:
+            if file.endswith(".json") and kept < self.max_entries and kept_bytes + size <= self.max_bytes:
+                kept += 1
+                kept_bytes += size
+                continue
+            try:
+                os.remove(file)
+            except OSError:
+                pass
+
+    def get(self, url: str):
+        record = super().get(url)
+        if record is None:
+            try:
+                with open(self._file(url), encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                return None
+            super().set(url, record)
+        return record
+
+    def set(self, url: str, record: dict):
+        super().set(url, record)
+        if url not in self:
+            # Too large to keep at all; drop any older copy too
+            self._evicted(url)
+            return
+        tmp_file = self._file(url) + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(record, f)
+            os.replace(tmp_file, self._file(url))
+        except OSError:
+            pass
+
+    def _evicted(self, url: str):
+        try:
+            os.remove(self._file(url))
+        except OSError:
+            pass
+
+class ConditionalStore:
+    """Send If-None-Match / If-Modified-Since and replay stored bodies on 304."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.not_modified = 0
+        self.modified = 0
+
+    async def get(self, client: httpx.AsyncClient, url: str, headers: dict, timeout) -> httpx.Response:
+        """GET url, returning the stored body as a 200 response when unchanged."""
+        record = self.backend.get(url)
+        request_headers = dict(headers)
+        if record is not None:
+            if record.get("etag"):
+                request_headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                request_headers["If-Modified-Since"] = record["last_modified"]
+
+        response = await client.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and record is not None:
+            self.not_modified += 1
+            replay_headers = {"Content-Type": "application/json", "ETag": record.get("etag") or ""}
+            # Pagination links are needed to walk the remaining pages
+            if record.get("link"):
+                replay_headers["Link"] = record["link"]
+            return httpx.Response(
+                200,
+                content=record["body"].encode("utf-8"),
+                headers=replay_headers,
+                request=response.request
+            )
+
+        if response.status_code == 200:
+            self.modified += 1
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.backend.set(url, {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "link": response.headers.get("Link"),
+                    "body": response.text
+                })
+        return response
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.backend),
+            "bytes": self.backend.bytes,
+            "max_bytes": self.backend.max_bytes,
+            "evictions": self.backend.evictions,
+            "persistent": isinstance(self.backend, DiskBackend),
+            "not_modified": self.not_modified,
+            "modified": self.modified
+        }
+
+def _create_store() -> ConditionalStore:
+    if ETAG_STORE_PATH:
+        return ConditionalStore(DiskBackend(ETAG_STORE_PATH, ETAG_STORE_MAX_ENTRIES, ETAG_STORE_MAX_BYTES))
+    return ConditionalStore(MemoryBackend(ETAG_STORE_MAX_ENTRIES, ETAG_STORE_MAX_BYTES))
+
+# Upstream REST responses, shared by all requests
+etag_store = _create_store()
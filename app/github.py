@@ -1,125 +1,312 @@
+import asyncio
 import httpx
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
+from .http_client import TIMEOUTS, get_client
+from . import graphql
+from .etag_store import etag_store
+from .repo_languages import repo_language_cache
+from .tokens import token_pool
+from .contrib_store import contrib_store
+from . import analytics
+from .metrics import timed
+from . import deadline
+from .deadline import STATS_DEADLINE
 
-def get_user_stats(username: str, github_token: str = None):
-    """Fetch GitHub user statistics from the GitHub API."""
-    user_url = f"https://api.github.com/users/{username}"
-    
-    # Use token from parameter or environment
-    token = github_token or os.getenv("GITHUB_TOKEN")
+# Maximum number of languages_url requests in flight at once
+LANGUAGE_CONCURRENCY = int(os.getenv("GITHUB_LANGUAGE_CONCURRENCY", "10"))
+
+# Contributions and the first page of repo languages share one round trip
+STATS_QUERY = graphql.build_user_query(graphql.CALENDAR_SECTION, graphql.REPOSITORIES_SECTION)
+CALENDAR_QUERY = graphql.build_user_query(graphql.CALENDAR_SECTION)
+
+# Independently computable parts of get_user_stats and the fields each one
+# fills. The profile is always fetched (it tells whether the user exists);
+# the grade needs the contribution calendar but not the other contribution fields.
+SECTIONS = {
+    "profile": ("username", "name", "public_repos", "followers", "following", "bio", "location", "created_at",
+                "avatar_url"),
+    "contributions": ("commits_this_year", "max_streak", "current_streak", "longest_gap", "active_days",
+                      "average_7d", "average_30d", "weekday_distribution", "percentiles", "contribution_days"),
+    "languages": ("languages",),
+    "grade": ("grade",),
+}
+FIELD_SECTIONS = {field: section for section, fields in SECTIONS.items() for field in fields}
+
+async def fetch_user(client: httpx.AsyncClient, username: str, headers: dict):
+    """Fetch the user profile, or None if the user does not exist."""
+    response = await etag_store.get(client, f"https://api.github.com/users/{username}", headers, TIMEOUTS["user"])
+
+    if response.status_code == 404:
+        return None
+
+    response.raise_for_status()
+    return response.json()
+
+def calendar_days(calendar: dict) -> list:
+    """Flatten a contribution calendar into a list of {"date", "count"} dicts."""
+    contribution_days = []
+    for week in calendar["weeks"]:
+        for day in week["contributionDays"]:
+            contribution_days.append({
+                "date": day["date"],
+                "count": day["contributionCount"]
+            })
+    return contribution_days
+
+def _last_page(response: httpx.Response) -> int:
+    """Read the last page number from a paginated response's Link header."""
+    last_url = response.links.get("last", {}).get("url")
+    if not last_url:
+        return 1
+    return int(httpx.URL(last_url).params.get("page", 1))
+
+async def iter_pages(client: httpx.AsyncClient, url: str, headers: dict, semaphore: asyncio.Semaphore):
+    """Yield the pages of a paginated REST listing (url ends in ?per_page=N) as they arrive.
+
+    Once the first page gives the last page number, the remaining pages are
+    fetched concurrently. Raises httpx.HTTPStatusError if any page fails so an
+    incomplete listing is never mistaken for the full one.
+    """
+    async def fetch_page(page):
+        async with semaphore:
+            page_url = url if page == 1 else f"{url}&page={page}"
+            response = await etag_store.get(client, page_url, headers, TIMEOUTS["repos"])
+        response.raise_for_status()
+        return response
+
+    first_page = await fetch_page(1)
+    yield first_page.json()
+
+    for next_page in asyncio.as_completed([fetch_page(page) for page in range(2, _last_page(first_page) + 1)]):
+        yield (await next_page).json()
+
+async def fetch_rest_language_totals(client: httpx.AsyncClient, owner: str, repos_url: str, headers: dict,
+                                     concurrency: int):
+    """Paginated repo listing plus one languages_url call per changed repo.
+
+    `owner` keys the per-repo language cache; `repos_url` is the owner's
+    repo listing. Returns (languages, colors); REST reports no colors.
+    """
+    if not deadline.allows("languages"):
+        return {}, {}
+    # Repo pages and languages_url calls share one concurrency budget
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(repo):
+        async with semaphore:
+            # Out of time: the repo is left for the next aggregation
+            if not deadline.allows("languages"):
+                return None
+            try:
+                # Unchanged repos answer 304, which does not count against the rate limit
+                lang_response = await etag_store.get(client, repo['languages_url'], headers, TIMEOUTS["languages"])
+            except httpx.TimeoutException:
+                deadline.skip("languages")
+                return None
+        if lang_response.status_code == 200:
+            return lang_response.json()
+        return None
+
+    async def owned_repo_pages():
+        async for repos in iter_pages(client, repos_url, headers, semaphore):
+            yield [
+                repo for repo in repos
+                if not repo.get('fork') and repo.get('languages_url')  # Skip forked repos
+            ]
+
+    try:
+        languages = await repo_language_cache.aggregate(owner, owned_repo_pages(), fetch_one)
+    except httpx.HTTPStatusError:
+        # Without a complete repo listing the card is still useful without languages
+        return {}, {}
+    except httpx.TimeoutException:
+        deadline.skip("languages")
+        return {}, {}
+    return languages, {}
+
+async def _fetch_rest_language_totals(client: httpx.AsyncClient, username: str, headers: dict, concurrency: int):
+    """Token-less fallback for a user's languages."""
+    repos_url = f"https://api.github.com/users/{username}/repos?per_page=100"
+    return await fetch_rest_language_totals(client, username.lower(), repos_url, headers, concurrency)
+
+def _calendar_window(login: str):
+    """(year_start, since, to) for the rolling year, where `since` skips days already stored.
+
+    `since` and `to` are the timestamps to query; `year_start` is the first
+    stored day to read back.
+    """
+    now = datetime.utcnow()
+    earliest = now - timedelta(days=365)
+    year_start = earliest.date().isoformat()
+    stored = contrib_store.last_date(login)
+    # GitHub limits a contributionsCollection range to one year, so a first
+    # load starts at exactly a year ago rather than at that day's midnight
+    since = f"{stored}T00:00:00Z" if stored and stored > year_start else earliest.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return year_start, since, now.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def year_to_date(contribution_days: list) -> int:
+    """Contributions since January 1 (UTC); the stored rolling year always covers it."""
+    year_start = f"{datetime.utcnow().year}-01-01"
+    return sum(day["count"] for day in contribution_days if day["date"] >= year_start)
+
+async def fetch_contribution_days(client: httpx.AsyncClient, username: str, headers: dict):
+    """Daily contributions for the last 365 days, requesting only days not stored yet."""
+    login = username.lower()
+    year_start, since, to = _calendar_window(login)
+    data = None
+    if deadline.allows("contributions"):
+        try:
+            with timed("contributions"):
+                data = await graphql.post_graphql(
+                    client,
+                    CALENDAR_QUERY,
+                    {"username": username, "from": since, "to": to},
+                    headers
+                )
+        except httpx.TimeoutException:
+            deadline.skip("contributions")
+    if data and data.get("user") and data["user"].get("contributionsCollection"):
+        contrib_store.save(login, calendar_days(data["user"]["contributionsCollection"]["contributionCalendar"]))
+    return contrib_store.days(login, year_start)
+
+async def _fetch_graphql_stats(client: httpx.AsyncClient, username: str, headers: dict, concurrency: int):
+    """Fetch contributions and repo languages, joined into one GraphQL round trip.
+
+    Contribution days are kept in the contribution store, so after the first
+    load only the days from the last stored date onward are requested.
+    """
+    login = username.lower()
+    year_start, since, to = _calendar_window(login)
+    repositories = None
+
+    # Contributions plus the first page of languages
+    data = None
+    if deadline.allows("contributions"):
+        try:
+            with timed("graphql"):
+                data = await graphql.post_graphql(
+                    client,
+                    STATS_QUERY,
+                    {
+                        "username": username,
+                        "from": since,
+                        "to": to,
+                        "cursor": None,
+                        "languages": graphql.LANGUAGES_PER_REPO
+                    },
+                    headers
+                )
+        except httpx.TimeoutException:
+            # Days stored by earlier fetches are still shown
+            deadline.skip("contributions")
+    if data:
+        user = data.get("user") or {}
+        if user.get("contributionsCollection"):
+            contrib_store.save(login, calendar_days(user["contributionsCollection"]["contributionCalendar"]))
+        # A user that does not exist gets no language refetch or REST fallback
+        repositories = graphql.user_repositories(data)
+
+    # Get daily contributions for the last 365 days
+    contribution_days = contrib_store.days(login, year_start)
+    return contribution_days, await _fetch_language_totals(client, username, headers, concurrency, repositories)
+
+async def _fetch_language_totals(client: httpx.AsyncClient, username: str, headers: dict, concurrency: int,
+                                 repositories: dict = None):
+    """Languages over GraphQL (continuing from an already fetched first page), falling back to REST."""
+    with timed("languages"):
+        language_totals = await graphql.fetch_languages(client, username, headers, repositories)
+        if language_totals is None:
+            language_totals = await _fetch_rest_language_totals(client, username, headers, concurrency)
+    return language_totals
+
+async def get_user_stats(username: str, github_token: str = None, client: httpx.AsyncClient = None,
+                         concurrency: int = None, profile: dict = None, deadline_seconds: float = STATS_DEADLINE,
+                         sections=None):
+    """Fetch GitHub user statistics from the GitHub API.
+
+    `profile` is an already fetched REST-shaped user profile (e.g. from a
+    batched GraphQL query), which saves the /users/{username} call.
+
+    `sections` limits the result to those SECTIONS (all by default), and only
+    their upstream calls are made: profile alone is one REST call.
+
+    Every upstream call shares a deadline of `deadline_seconds` (None for no
+    limit). When it runs short, languages and then contributions stop early
+    and the stats come back with "partial" set; whatever was fetched is kept
+    (contribution store, per-repo language cache), so running again without
+    a deadline completes them cheaply.
+    """
+    with deadline.limit(deadline_seconds) as limit:
+        stats = await _fetch_user_stats(username, github_token, client, concurrency, profile, sections)
+    if stats is not None:
+        stats["partial"] = bool(limit and limit.skipped)
+    return stats
+
+async def _fetch_user_stats(username: str, github_token: str, client: httpx.AsyncClient, concurrency: int,
+                            profile: dict, sections):
+    # An explicit token overrides the shared pool (GITHUB_TOKENS / GITHUB_TOKEN)
     headers = {}
-    if token:
-        headers["Authorization"] = f"token {token}"
-    
+    if github_token:
+        headers["Authorization"] = f"token {github_token}"
+    authenticated = bool(github_token) or token_pool.has_tokens()
+    sections = set(SECTIONS) if sections is None else set(sections) | {"profile"}
+    # Contributions need GraphQL, which needs a token
+    need_calendar = authenticated and bool(sections & {"contributions", "grade"})
+    need_languages = "languages" in sections
+
+    # All requests share the process-wide connection pool
+    client = client or get_client()
+
     try:
-        # Get user info
-        response = httpx.get(user_url, timeout=10.0, headers=headers)
-        
-        if response.status_code == 404:
+        async def calendar_only():
+            return await fetch_contribution_days(client, username, headers), ({}, {})
+
+        async def languages_only():
+            if authenticated:
+                return [], await _fetch_language_totals(client, username, headers, concurrency)
+            with timed("languages"):
+                return [], await _fetch_rest_language_totals(client, username, headers, concurrency)
+
+        async def no_stats():
+            return [], ({}, {})
+
+        async def user_profile():
+            if profile is not None:
+                return profile
+            with timed("user"):
+                return await fetch_user(client, username, headers)
+
+        concurrency = concurrency or LANGUAGE_CONCURRENCY
+
+        # Calendar and languages share one GraphQL round trip when both are wanted
+        if need_calendar and need_languages:
+            stats_fetch = _fetch_graphql_stats(client, username, headers, concurrency)
+        elif need_calendar:
+            stats_fetch = calendar_only()
+        elif need_languages:
+            stats_fetch = languages_only()
+        else:
+            stats_fetch = no_stats()
+
+        # User info and the other sections are independent
+        data, (contribution_days, (languages, colors)) = await asyncio.gather(user_profile(), stats_fetch)
+
+        if data is None:
             return None
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        # Get contributions using GraphQL API
-        commits_this_year = 0
-        max_streak = 0
-        contribution_days = []
-        current_year = datetime.now().year
-        
-        if token:
-            # Use GraphQL to get accurate contribution count and daily data
-            graphql_url = "https://api.github.com/graphql"
-            query = """
-            query($username: String!) {
-              user(login: $username) {
-                contributionsCollection {
-                  contributionCalendar {
-                    totalContributions
-                    weeks {
-                      contributionDays {
-                        contributionCount
-                        date
-                      }
-                    }
-                  }
-                }
-              }
-            }
-            """
-            
-            graphql_response = httpx.post(
-                graphql_url,
-                json={"query": query, "variables": {"username": username}},
-                headers=headers,
-                timeout=10.0
-            )
-            
-            if graphql_response.status_code == 200:
-                graphql_data = graphql_response.json()
-                if "data" in graphql_data and graphql_data["data"]["user"]:
-                    calendar = graphql_data["data"]["user"]["contributionsCollection"]["contributionCalendar"]
-                    commits_this_year = calendar["totalContributions"]
-                    
-                    # Get daily contributions for the last 365 days
-                    for week in calendar["weeks"]:
-                        for day in week["contributionDays"]:
-                            contribution_days.append({
-                                "date": day["date"],
-                                "count": day["contributionCount"]
-                            })
-                    
-                    # Calculate max streak
-                    current_streak = 0
-                    for day in contribution_days:
-                        if day["count"] > 0:
-                            current_streak += 1
-                            max_streak = max(max_streak, current_streak)
-                        else:
-                            current_streak = 0
-        
-        # Get language statistics from repositories
-        languages = {}
-        repos_url = f"https://api.github.com/users/{username}/repos?per_page=100"
-        repos_response = httpx.get(repos_url, timeout=10.0, headers=headers)
-        
-        if repos_response.status_code == 200:
-            repos = repos_response.json()
-            for repo in repos:
-                if not repo.get('fork'):  # Skip forked repos
-                    lang_url = repo.get('languages_url')
-                    if lang_url:
-                        lang_response = httpx.get(lang_url, timeout=5.0, headers=headers)
-                        if lang_response.status_code == 200:
-                            repo_languages = lang_response.json()
-                            for lang, bytes_count in repo_languages.items():
-                                languages[lang] = languages.get(lang, 0) + bytes_count
-        
-        # Get top 10 languages
-        top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:10]
-        total_bytes = sum(languages.values()) if languages else 1
-        
-        # Calculate percentages with proper rounding
-        language_stats = []
-        remaining_percentage = 100.0
-        
-        for i, (lang, bytes_count) in enumerate(top_languages):
-            if i == len(top_languages) - 1:
-                # Last language gets the remaining percentage to ensure sum = 100%
-                percentage = round(remaining_percentage, 1)
-            else:
-                percentage = round((bytes_count / total_bytes) * 100, 1)
-                remaining_percentage -= percentage
-            
-            language_stats.append({"name": lang, "percentage": percentage})
-        
+
+        with timed("analytics"):
+            activity = analytics.summarize(contribution_days)
+        # The card's headline number is the calendar year-to-date total;
+        # streaks and averages cover the whole rolling year
+        commits_this_year = year_to_date(contribution_days)
+
         # Calculate grade
         public_repos = data.get("public_repos", 0)
         followers = data.get("followers", 0)
         grade = calculate_grade(public_repos, followers, commits_this_year)
-        
-        return {
+
+        stats = {
             "username": data.get("login"),
             "name": data.get("name"),
             "public_repos": public_repos,
@@ -129,19 +316,47 @@ def get_user_stats(username: str, github_token: str = None):
             "location": data.get("location"),
             "created_at": data.get("created_at"),
             "commits_this_year": commits_this_year,
-            "max_streak": max_streak,
+            "max_streak": activity["max_streak"],
+            "current_streak": activity["current_streak"],
+            "longest_gap": activity["longest_gap"],
+            "active_days": activity["active_days"],
+            "average_7d": activity["average_7d"],
+            "average_30d": activity["average_30d"],
+            "weekday_distribution": activity["weekday_distribution"],
+            "percentiles": activity["percentiles"],
             "contribution_days": contribution_days[-90:],  # Last 90 days for graph
             "grade": grade,
             "avatar_url": data.get("avatar_url"),
-            "languages": language_stats
+            "languages": top_languages(languages, colors)
         }
+        return {field: value for field, value in stats.items() if FIELD_SECTIONS[field] in sections}
     except httpx.HTTPError:
         return None
 
+def top_languages(languages: dict, colors: dict, limit: int = 10) -> list:
+    """The `limit` largest languages by bytes, as {"name", "percentage", "color"} dicts."""
+    top = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:limit]
+    total_bytes = sum(languages.values()) if languages else 1
+
+    # Calculate percentages with proper rounding
+    language_stats = []
+    remaining_percentage = 100.0
+
+    for i, (lang, bytes_count) in enumerate(top):
+        if i == len(top) - 1:
+            # Last language gets the remaining percentage to ensure sum = 100%
+            percentage = round(remaining_percentage, 1)
+        else:
+            percentage = round((bytes_count / total_bytes) * 100, 1)
+            remaining_percentage -= percentage
+
+        language_stats.append({"name": lang, "percentage": percentage, "color": colors.get(lang)})
+    return language_stats
+
 def calculate_grade(repos: int, followers: int, commits: int) -> str:
     """Calculate a grade based on GitHub activity."""
     score = (repos * 2) + (followers * 1.5) + (commits * 0.5)
-    
+
     if score >= 500:
         return "S+"
     elif score >= 300:
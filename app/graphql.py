@@ -0,0 +1,223 @@
+import os
+import httpx
+from .http_client import TIMEOUTS
+from .tokens import token_pool
+from . import deadline
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Number of languages read per repository (GitHub returns them largest first)
+LANGUAGES_PER_REPO = int(os.getenv("GITHUB_LANGUAGES_PER_REPO", "10"))
+
+# Query sections that can share a single user(login:) round trip. Each one
+# declares the variables it needs and the (aliased) fields it selects.
+CALENDAR_SECTION = {
+    "variables": {"from": "DateTime!", "to": "DateTime!"},
+    "fields": """
+    contributionsCollection(from: $from, to: $to) {
+      contributionCalendar {
+        totalContributions
+        weeks {
+          contributionDays {
+            contributionCount
+            date
+          }
+        }
+      }
+    }"""
+}
+
+# Public repos only, like the REST listing: a token belonging to the user
+# would otherwise put their private repos' languages on a public card
+REPOSITORIES_SECTION = {
+    "variables": {"cursor": "String", "languages": "Int!"},
+    "fields": """
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER, isFork: false, privacy: PUBLIC) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        languages(first: $languages, orderBy: {field: SIZE, direction: DESC}) {
+          edges {
+            size
+            node {
+              name
+              color
+            }
+          }
+        }
+      }
+    }"""
+}
+
+def year_calendar_section(year: int) -> dict:
+    """One year's calendar, aliased (y2024: ...) so several years can share a query."""
+    return {
+        "variables": {f"from{year}": "DateTime!", f"to{year}": "DateTime!"},
+        "fields": f"""
+    y{year}: contributionsCollection(from: $from{year}, to: $to{year}) {{
+      contributionCalendar {{
+        weeks {{
+          contributionDays {{
+            contributionCount
+            date
+          }}
+        }}
+      }}
+    }}"""
+    }
+
+def build_user_query(*sections) -> str:
+    """Join query sections into one query against user(login: $username).
+
+    Every query also reports its rate-limit cost so the token pool can track it.
+    """
+    variables = {"username": "String!"}
+    for section in sections:
+        variables.update(section["variables"])
+
+    declarations = ", ".join(f"${name}: {kind}" for name, kind in variables.items())
+    fields = "".join(section["fields"] for section in sections)
+    return (
+        f"query({declarations}) {{\n"
+        f"  rateLimit {{\n    cost\n    remaining\n    resetAt\n  }}\n"
+        f"  user(login: $username) {{{fields}\n  }}\n}}\n"
+    )
+
+LANGUAGES_QUERY = build_user_query(REPOSITORIES_SECTION)
+
+# The REST /users/{username} fields the stats need, read through GraphQL
+PROFILE_FIELDS = """
+    login
+    name
+    bio
+    location
+    createdAt
+    avatarUrl
+    followers {
+      totalCount
+    }
+    following {
+      totalCount
+    }
+    repositories(ownerAffiliations: OWNER, privacy: PUBLIC) {
+      totalCount
+    }"""
+
+def build_profiles_query(count: int) -> str:
+    """One query reading `count` user profiles, aliased u0..u{count-1} with logins $login0..."""
+    declarations = ", ".join(f"$login{i}: String!" for i in range(count))
+    users = "".join(f"\n  u{i}: user(login: $login{i}) {{{PROFILE_FIELDS}\n  }}" for i in range(count))
+    return (
+        f"query({declarations}) {{\n"
+        f"  rateLimit {{\n    cost\n    remaining\n    resetAt\n  }}{users}\n}}\n"
+    )
+
+def profile_from_graphql(user: dict) -> dict:
+    """Reshape a GraphQL profile like the REST user response."""
+    return {
+        "login": user["login"],
+        "name": user["name"],
+        "bio": user["bio"],
+        "location": user["location"],
+        "created_at": user["createdAt"],
+        "avatar_url": user["avatarUrl"],
+        "followers": user["followers"]["totalCount"],
+        "following": user["following"]["totalCount"],
+        "public_repos": user["repositories"]["totalCount"]
+    }
+
+async def fetch_profiles(client: httpx.AsyncClient, usernames: list, headers: dict):
+    """Fetch several profiles in one aliased query.
+
+    Returns {username: profile}, with None for users that do not exist, or
+    None if the query failed.
+    """
+    data = await post_graphql(
+        client,
+        build_profiles_query(len(usernames)),
+        {f"login{i}": username for i, username in enumerate(usernames)},
+        headers
+    )
+    if data is None:
+        return None
+    return {
+        username: profile_from_graphql(data[f"u{i}"]) if data.get(f"u{i}") else None
+        for i, username in enumerate(usernames)
+    }
+
+async def post_graphql(client: httpx.AsyncClient, query: str, variables: dict, headers: dict):
+    """Run a GraphQL query and return its data, or None if it failed."""
+    response = await client.post(
+        GRAPHQL_URL,
+        json={"query": query, "variables": variables},
+        headers=headers,
+        timeout=TIMEOUTS["graphql"]
+    )
+
+    if response.status_code != 200:
+        return None
+
+    # Partial data is still usable; callers check the sections they need
+    data = response.json().get("data")
+    token_pool.update_graphql(response.request, (data or {}).get("rateLimit"))
+    return data
+
+# What a user that does not exist owns: nothing to fall back to REST for
+NO_REPOSITORIES = {"pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": []}
+
+def user_repositories(data: dict):
+    """The repositories page of a user(login:) query's data, NO_REPOSITORIES if the user does not exist."""
+    if not data.get("user"):
+        return NO_REPOSITORIES
+    return data["user"].get("repositories")
+
+async def _fetch_repositories_page(client: httpx.AsyncClient, username: str, headers: dict, cursor: str):
+    """Fetch one page of the repositories connection, or None on failure."""
+    data = await post_graphql(
+        client,
+        LANGUAGES_QUERY,
+        {"username": username, "cursor": cursor, "languages": LANGUAGES_PER_REPO},
+        headers
+    )
+    if data is None:
+        return None
+    return user_repositories(data)
+
+async def fetch_languages(client: httpx.AsyncClient, username: str, headers: dict, repositories: dict = None):
+    """Sum language bytes over all owned, non-forked repos in 1-3 GraphQL round trips.
+
+    `repositories` is an already fetched first page (e.g. joined onto another
+    query). Returns (languages, colors), summed over the pages read before
+    the deadline if it runs out, or None if GraphQL is unavailable so callers
+    can fall back to the REST languages_url fan-out.
+    """
+    languages = {}
+    colors = {}
+
+    try:
+        if repositories is None:
+            # Languages are dropped before contributions, so they never start late
+            if not deadline.allows("languages"):
+                return languages, colors
+            repositories = await _fetch_repositories_page(client, username, headers, None)
+
+        while repositories is not None:
+            for repo in repositories["nodes"]:
+                for edge in repo["languages"]["edges"]:
+                    name = edge["node"]["name"]
+                    languages[name] = languages.get(name, 0) + edge["size"]
+                    if edge["node"]["color"]:
+                        colors[name] = edge["node"]["color"]
+
+            page_info = repositories["pageInfo"]
+            # Out of time: keep the totals summed so far
+            if not page_info["hasNextPage"] or not deadline.allows("languages"):
+                return languages, colors
+            repositories = await _fetch_repositories_page(client, username, headers, page_info["endCursor"])
+    except httpx.TimeoutException:
+        deadline.skip("languages")
+        return languages, colors
+
+    return None
@@ -0,0 +1,130 @@
+import asyncio
+import os
+from datetime import date, datetime
+import httpx
+from .http_client import get_client
+from . import graphql
+from .github import fetch_user, calendar_days
+from .tokens import token_pool
+from .contrib_store import contrib_store
+from . import analytics
+
+# Years joined into one aliased GraphQL query, and such queries in flight at once
+HISTORY_YEARS_PER_QUERY = int(os.getenv("HISTORY_YEARS_PER_QUERY", "4"))
+HISTORY_CONCURRENCY = int(os.getenv("HISTORY_CONCURRENCY", "4"))
+
+def _year_range(year: int, created: date, today: date) -> tuple:
+    """First and last day of `year` that can hold contributions."""
+    start = max(date(year, 1, 1), created)
+    end = min(date(year, 12, 31), today)
+    return start.isoformat(), end.isoformat()
+
+async def _fetch_years(client: httpx.AsyncClient, username: str, headers: dict, ranges: dict) -> dict:
+    """Fetch {year: (from, to)} calendars in one aliased query; returns {year: days} for those that came back."""
+    query = graphql.build_user_query(*(graphql.year_calendar_section(year) for year in ranges))
+    variables = {"username": username}
+    for year, (start, end) in ranges.items():
+        variables[f"from{year}"] = f"{start}T00:00:00Z"
+        variables[f"to{year}"] = f"{end}T23:59:59Z"
+
+    data = await graphql.post_graphql(client, query, variables, headers)
+    if not data or not data.get("user"):
+        return {}
+    return {
+        year: calendar_days(data["user"][f"y{year}"]["contributionCalendar"])
+        for year in ranges
+        if data["user"].get(f"y{year}")
+    }
+
+def _monthly_totals(contribution_days: list) -> list:
+    """Sum daily counts into 12 monthly totals (dates are ISO strings)."""
+    months = [0] * 12
+    for day in contribution_days:
+        months[int(day["date"][5:7]) - 1] += day["count"]
+    return months
+
+async def get_user_history(username: str, github_token: str = None, client: httpx.AsyncClient = None,
+                           concurrency: int = None):
+    """Fetch lifetime contribution history, one calendar per year since the account was created.
+
+    Past years cannot change, so once stored they are never requested again;
+    only the current year is refetched, and only from its last stored day.
+    """
+    headers = {}
+    if github_token:
+        headers["Authorization"] = f"token {github_token}"
+    authenticated = bool(github_token) or token_pool.has_tokens()
+    client = client or get_client()
+    concurrency = concurrency or HISTORY_CONCURRENCY
+
+    try:
+        data = await fetch_user(client, username, headers)
+        if data is None:
+            return None
+
+        login = username.lower()
+        today = datetime.utcnow().date()
+        created = datetime.strptime(data["created_at"][:10], "%Y-%m-%d").date()
+        years = list(range(created.year, today.year + 1))
+        closed = contrib_store.closed_years(login)
+
+        ranges = {}
+        for year in years:
+            if year in closed:
+                continue
+            start, end = _year_range(year, created, today)
+            if year == today.year:
+                # The running year is topped up from the last stored day
+                start = max(contrib_store.last_date(login) or start, start)
+            ranges[year] = (start, end)
+
+        fetched_years = set()
+        # Contributions need GraphQL, which needs a token
+        if ranges and authenticated:
+            semaphore = asyncio.Semaphore(concurrency)
+            pending = sorted(ranges)
+            batches = [pending[i:i + HISTORY_YEARS_PER_QUERY] for i in range(0, len(pending), HISTORY_YEARS_PER_QUERY)]
+
+            async def fetch_batch(batch):
+                async with semaphore:
+                    return await _fetch_years(client, username, headers, {year: ranges[year] for year in batch})
+
+            for fetched in await asyncio.gather(*(fetch_batch(batch) for batch in batches)):
+                for year, days in fetched.items():
+                    contrib_store.save(login, days)
+                    fetched_years.add(year)
+                    if year < today.year:
+                        contrib_store.close_year(login, year)
+
+        # Years that failed to fetch are missing from the store, not zero
+        contribution_days = contrib_store.days(login, created.isoformat())
+        lifetime = analytics.summarize_runs(contribution_days)
+
+        per_year = []
+        for year in years:
+            start, end = _year_range(year, created, today)
+            year_days = contrib_store.days(login, start, end)
+            activity = analytics.summarize_runs(year_days)
+            per_year.append({
+                "year": year,
+                "total": activity["total"],
+                "active_days": activity["active_days"],
+                "max_streak": activity["max_streak"],
+                "monthly": _monthly_totals(year_days)
+            })
+
+        return {
+            "username": data.get("login"),
+            "created_at": data.get("created_at"),
+            # False when some year could not be fetched (no token, or a failed query)
+            "complete": fetched_years >= set(ranges),
+            "total_contributions": lifetime["total"],
+            "active_days": lifetime["active_days"],
+            "max_streak": lifetime["max_streak"],
+            "current_streak": lifetime["current_streak"],
+            "longest_gap": lifetime["longest_gap"],
+            "weekday_distribution": lifetime["weekday_distribution"],
+            "years": per_year
+        }
+    except httpx.HTTPError:
+        return None
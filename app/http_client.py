@@ -0,0 +1,111 @@
+import os
+import time
+import httpx
+from . import deadline
+from . import metrics
+from .tokens import TokenPoolAuth, token_pool
+
+# Connection pool limits, tunable per deployment
+MAX_CONNECTIONS = int(os.getenv("GITHUB_POOL_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("GITHUB_POOL_MAX_KEEPALIVE", "20"))
+KEEPALIVE_EXPIRY = float(os.getenv("GITHUB_POOL_KEEPALIVE_EXPIRY", "30.0"))
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2 = os.getenv("GITHUB_HTTP2", "").lower() in ("1", "true", "yes")
+
+# Per-phase timeouts in seconds
+TIMEOUTS = {
+    "user": float(os.getenv("GITHUB_TIMEOUT_USER", "10.0")),
+    "graphql": float(os.getenv("GITHUB_TIMEOUT_GRAPHQL", "10.0")),
+    "repos": float(os.getenv("GITHUB_TIMEOUT_REPOS", "10.0")),
+    "languages": float(os.getenv("GITHUB_TIMEOUT_LANGUAGES", "5.0")),
+}
+
+_client = None
+_http2_enabled = False
+_request_count = 0
+
+def _http2_available() -> bool:
+    """Check whether the h2 package is installed."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+async def _count_request(request):
+    global _request_count
+    _request_count += 1
+    request.extensions["started"] = time.perf_counter()
+    # Every upstream call of a stats fetch respects its overall deadline
+    deadline.clamp_timeouts(request)
+
+async def _record_response(response):
+    request = response.request
+    seconds = time.perf_counter() - request.extensions.get("started", time.perf_counter())
+    metrics.record_upstream(metrics.upstream_kind(request.url.path), response.status_code, seconds)
+
+def create_client(transport: httpx.AsyncBaseTransport = None) -> httpx.AsyncClient:
+    """Create a pooled client with keep-alive for api.github.com.
+
+    Requests are signed by the token pool unless they carry their own token.
+    `transport` replaces the network, e.g. with a fake GitHub for benchmarks.
+    """
+    global _http2_enabled
+    _http2_enabled = HTTP2 and _http2_available()
+
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=_http2_enabled,
+        timeout=TIMEOUTS["user"],
+        auth=TokenPoolAuth(token_pool),
+        event_hooks={"request": [_count_request], "response": [_record_response]},
+        transport=transport
+    )
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_client()
+    return _client
+
+async def start_client(transport: httpx.AsyncBaseTransport = None) -> httpx.AsyncClient:
+    """Open the shared client (called from the FastAPI lifespan)."""
+    global _client
+    if transport is not None:
+        await close_client()
+        _client = create_client(transport)
+    return get_client()
+
+async def close_client():
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def pool_stats() -> dict:
+    """Report connection pool usage for sizing the pool under load."""
+    connections = []
+    if _client is not None:
+        pool = getattr(_client._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+
+    idle = sum(1 for conn in connections if conn.is_idle())
+    return {
+        "max_connections": MAX_CONNECTIONS,
+        "max_keepalive_connections": MAX_KEEPALIVE_CONNECTIONS,
+        "keepalive_expiry": KEEPALIVE_EXPIRY,
+        "http2": _http2_enabled,
+        "connections": len(connections),
+        "idle": idle,
+        "active": len(connections) - idle,
+        "requests": _request_count,
+        "timeouts": TIMEOUTS
+    }
@@ -1,310 +1,277 @@
-from fastapi import FastAPI
-from fastapi.responses import Response
-from github import get_user_stats
+from fastapi import Body, FastAPI, Header
+from fastapi.responses import Response, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from contextlib import asynccontextmanager
+import json
 import os
+import httpx
+import re
+from typing import List
 from dotenv import load_dotenv
 from pathlib import Path
 
-# Load environment variables from parent directory
+# Load environment variables from parent directory (before the modules that read them)
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
 
-app = FastAPI()
+from .github import get_user_stats, SECTIONS, FIELD_SECTIONS  # noqa: E402
+from .history import get_user_history  # noqa: E402
+from .batch import get_batch_stats, iter_batch_stats, BATCH_MAX_USERS  # noqa: E402
+from .orgs import get_org_stats, get_member_activity, org_card  # noqa: E402
+from .svg import card_hash, render_stats_card  # noqa: E402
+from .compression import compress, negotiate  # noqa: E402
+from .http_client import start_client, close_client, pool_stats  # noqa: E402
+from . import metrics  # noqa: E402
+from .metrics import ServerTimingMiddleware, timed  # noqa: E402
+from .cache import stats_cache, card_cache, CARD_CACHE_CONTROL, PARTIAL_CARD_CACHE_CONTROL  # noqa: E402
+from .etag_store import etag_store  # noqa: E402
+from .repo_languages import repo_language_cache  # noqa: E402
+from .tokens import token_pool  # noqa: E402
+from .contrib_store import contrib_store  # noqa: E402
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled HTTP client per process, shared by all requests
+    await start_client()
+    yield
+    await close_client()
+
+app = FastAPI(lifespan=lifespan)
+# JSON responses are compressed on the fly; cards arrive already encoded and are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Outermost, so the timing covers compression and the header survives it
+app.add_middleware(ServerTimingMiddleware)
+
+async def load_user_stats(username: str, profile: dict = None, sections: set = None):
+    """Return stats for username from the shared cache, fetching on a miss.
+
+    `sections` (default all) limits what is fetched; full stats already in
+    the cache serve any subset.
+    """
+    # GitHub logins are case-insensitive
+    key = username.lower()
+    if sections is None or sections >= set(SECTIONS) or key in stats_cache:
+        sections = None
+    else:
+        key = f"sections:{','.join(sorted(sections))}:{key}"
+
+    with timed("stats"):
+        stats_data = await stats_cache.get_or_fetch(
+            key, lambda: get_user_stats(username, profile=profile, sections=sections)
+        )
+    if stats_data is not None and stats_data.get("partial"):
+        # Cut short by the deadline: finish without one so the next request gets everything
+        stats_cache.refresh(key, lambda: get_user_stats(username, deadline_seconds=None, sections=sections))
+    return stats_data
+
+async def load_user_history(username: str):
+    """Return lifetime history for username from the shared cache, fetching on a miss."""
+    return await stats_cache.get_or_fetch(f"history:{username.lower()}", lambda: get_user_history(username))
+
+async def load_member_activity(username: str):
+    """Return an org member's contribution summary from the shared cache, fetching on a miss."""
+    return await stats_cache.get_or_fetch(f"activity:{username.lower()}", lambda: get_member_activity(username))
+
+async def load_org_stats(org: str):
+    """Return aggregate stats for org from the shared cache, fetching on a miss."""
+    return await stats_cache.get_or_fetch(f"org:{org.lower()}", lambda: get_org_stats(org, load_member_activity))
+
+def card_etag(stats_data: dict, options: dict = None) -> str:
+    """Strong ETag for a card: a hash of the stats and render options it is drawn from."""
+    return f'"{card_hash(stats_data, options)}"'
+
+def render_card(etag: str, stats_data: dict, options: dict = None) -> dict:
+    """Return {encoding: bytes} for a card, rendering and compressing only content not seen before."""
+    cached = card_cache.get(etag)
+    if cached is not None:
+        return cached[0]
+    with timed("render"):
+        variants = compress(render_stats_card(stats_data, options).encode("utf-8"))
+    card_cache.set(etag, variants)
+    return variants
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Each encoding is a different representation, so it gets its own strong ETag."""
+    if encoding == "identity":
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header names etag in any encoding (weak comparison, as RFC 9110 requires)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if re.sub(r'-(?:gzip|br)"$', '"', candidate) == etag:
+            return True
+    return False
+
+def card_response(stats_data: dict, if_none_match: str, accept_encoding: str, options: dict = None) -> Response:
+    """Serve a card with its ETag, answering 304 or the encoding the client accepts."""
+    # Clients holding the current card are answered before anything is rendered
+    etag = card_etag(stats_data, options)
+    encoding = negotiate(accept_encoding)
+    headers = {
+        "ETag": encoded_etag(etag, encoding),
+        "Cache-Control": PARTIAL_CARD_CACHE_CONTROL if stats_data.get("partial") else CARD_CACHE_CONTROL,
+        "Vary": "Accept-Encoding"
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=render_card(etag, stats_data, options)[encoding], media_type="image/svg+xml", headers=headers)
+
+# Card sections ?hide= can leave off; the profile and grade are always shown
+CARD_HIDEABLE = ("languages", "contributions")
+
+def parse_list(value: str) -> list:
+    """Split a comma-separated query parameter, dropping blanks and duplicates."""
+    items = []
+    for item in (value or "").split(","):
+        item = item.strip()
+        if item and item not in items:
+            items.append(item)
+    return items
 
 # You can set GITHUB_TOKEN environment variable for accurate contribution data
 @app.get("/")
 def root():
     return {"message": "Welcome to the GitHub User Stats API"}
 
+@app.get("/debug/pool")
+def pool():
+    return pool_stats()
+
+@app.get("/debug/cache")
+def cache():
+    return stats_cache.stats()
+
+@app.get("/debug/etags")
+def etags():
+    return etag_store.stats()
+
+@app.get("/debug/languages")
+def repo_languages():
+    return repo_language_cache.stats()
+
+@app.get("/debug/tokens")
+def tokens():
+    return token_pool.stats()
+
+@app.get("/debug/contributions")
+def contributions():
+    return contrib_store.stats()
+
+@app.get("/debug/cards")
+def cards():
+    return card_cache.stats()
+
+@app.get("/metrics")
+def prometheus_metrics():
+    caches = {"stats": stats_cache.stats(), "cards": card_cache.stats()}
+    etags = etag_store.stats()
+    languages = repo_language_cache.stats()
+    pool = pool_stats()
+    sections = [
+        metrics.gauge("github_stats_cache_hit_ratio", "Share of cache lookups served without fetching or rendering.",
+                      [({"cache": name}, stats["hit_ratio"]) for name, stats in caches.items()]),
+        metrics.gauge("github_stats_cache_lookups_total", "Cache lookups by result.",
+                      [({"cache": name, "result": result}, stats[result])
+                       for name, stats in caches.items() for result in ("hits", "stale_hits", "misses")], "counter"),
+        metrics.gauge("github_stats_cache_bytes", "Approximate bytes held by each cache.",
+                      [({"cache": name}, stats["bytes"]) for name, stats in caches.items()] + [({"cache": "etags"}, etags["bytes"])]),
+        metrics.gauge("github_stats_conditional_requests_total", "Revalidated upstream REST requests by result.",
+                      [({"result": "not_modified"}, etags["not_modified"]), ({"result": "modified"}, etags["modified"])], "counter"),
+        metrics.gauge("github_stats_repo_languages_total", "Per-repo language breakdowns reused or refetched.",
+                      [({"result": "reused"}, languages["reused"]), ({"result": "refetched"}, languages["refetched"])], "counter"),
+        metrics.gauge("github_stats_rate_limit_remaining", "GitHub rate-limit budget left, by token and API.",
+                      [({"token": token["token"], "api": kind}, budget["remaining"])
+                       for token in token_pool.stats()["tokens"] for kind, budget in token["budgets"].items()]),
+        metrics.gauge("github_stats_pool_connections", "Upstream connections by state.",
+                      [({"state": "active"}, pool["active"]), ({"state": "idle"}, pool["idle"])]),
+    ]
+    return Response(content=metrics.render(*sections), media_type="text/plain; version=0.0.4")
+
 @app.get("/stats")
-def stats(username: str):
-    stats_data = get_user_stats(username)
+async def stats(username: str, fields: str = None):
+    if not fields:
+        stats_data = await load_user_stats(username)
+        if stats_data is None:
+            return Response(content="User not found", status_code=404)
+        return stats_data
+
+    selected = parse_list(fields)
+    unknown = [field for field in selected if field not in FIELD_SECTIONS]
+    if unknown:
+        return Response(content=f"Unknown fields: {', '.join(unknown)}", status_code=400)
+    stats_data = await load_user_stats(username, sections={FIELD_SECTIONS[field] for field in selected})
     if stats_data is None:
         return Response(content="User not found", status_code=404)
-    return stats_data
+    return {field: stats_data[field] for field in selected + ["partial"]}
+
+@app.post("/stats/batch")
+async def stats_batch(usernames: List[str] = Body(..., embed=True), stream: bool = False):
+    if len(usernames) > BATCH_MAX_USERS:
+        return Response(content=f"At most {BATCH_MAX_USERS} usernames per batch", status_code=400)
+
+    def is_cached(username):
+        return username.lower() in stats_cache
+
+    if stream:
+        # One JSON object per line, in completion order
+        async def lines():
+            async for result in iter_batch_stats(usernames, load_user_stats, is_cached):
+                yield json.dumps(result) + "\n"
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    results = await get_batch_stats(usernames, load_user_stats, is_cached)
+    return {"results": results}
+
+@app.get("/stats/history")
+async def stats_history(username: str):
+    history_data = await load_user_history(username)
+    if history_data is None:
+        return Response(content="User not found", status_code=404)
+    return history_data
 
 @app.get("/stats/svg")
-def stats_svg(username: str):
-    stats_data = get_user_stats(username)
+async def stats_svg(username: str, hide: str = None, if_none_match: str = Header(None),
+                    accept_encoding: str = Header(None)):
+    hidden = parse_list(hide)
+    unknown = [section for section in hidden if section not in CARD_HIDEABLE]
+    if unknown:
+        return Response(content=f"Unknown sections: {', '.join(unknown)}", status_code=400)
+
+    # Hidden languages are not fetched at all; the calendar is still needed
+    # for the grade and headline numbers when only the graph is hidden
+    sections = set(SECTIONS) - ({"languages"} & set(hidden))
+    stats_data = await load_user_stats(username, sections=sections)
     if stats_data is None:
         return Response(content="User not found", status_code=404)
-    
-    # Determine grade color with better colors
-    grade = stats_data['grade']
-    if grade.startswith('S'):
-        grade_color = "#FFD700"
-        grade_glow = "#FFA500"
-    elif grade.startswith('A'):
-        grade_color = "#C0C0C0"
-        grade_glow = "#A8A8A8"
-    elif grade.startswith('B'):
-        grade_color = "#CD7F32"
-        grade_glow = "#B87333"
-    else:
-        grade_color = "#718096"
-        grade_glow = "#4A5568"
-    
-    name_display = stats_data['name'] or stats_data['username']
-    location = stats_data.get('location') or 'Not set'
-    
-    # Format joined date
-    from datetime import datetime
-    if stats_data.get('created_at'):
-        joined_date = datetime.strptime(stats_data['created_at'], "%Y-%m-%dT%H:%M:%SZ")
-        joined = joined_date.strftime("%b %Y")
-    else:
-        joined = "Unknown"
-    
-    # Language colors
-    lang_colors = {
-        "Python": "#3572A5",
-        "JavaScript": "#f1e05a",
-        "TypeScript": "#2b7489",
-        "Java": "#b07219",
-        "C++": "#f34b7d",
-        "C": "#555555",
-        "C#": "#178600",
-        "Go": "#00ADD8",
-        "Rust": "#dea584",
-        "Ruby": "#701516",
-        "PHP": "#4F5D95",
-        "HTML": "#e34c26",
-        "CSS": "#563d7c",
-        "Shell": "#89e051",
-        "Dart": "#00B4AB",
-        "Kotlin": "#A97BFF",
-        "Swift": "#ffac45"
-    }
-    
-    # Generate language bars with improved styling
-    languages = stats_data.get('languages', [])
-    lang_bars = ""
-    y_offset = 0
-    
-    for lang_data in languages:
-        lang = lang_data['name']
-        percentage = lang_data['percentage']
-        color = lang_colors.get(lang, "#858585")
-        bar_width = (percentage / 100) * 420  # Max width 420px
-        
-        lang_bars += f'''
-        <g transform="translate(0, {y_offset})">
-            <rect x="0" y="0" width="420" height="28" rx="6" fill="rgba(255,255,255,0.05)"/>
-            <rect x="2" y="2" width="{bar_width}" height="24" rx="5" fill="{color}" opacity="0.9">
-                <animate attributeName="width" from="0" to="{bar_width}" dur="1s" fill="freeze"/>
-            </rect>
-            <text x="14" y="18" font-family="'Segoe UI', Arial, sans-serif" font-size="12" fill="#ffffff" font-weight="600">{lang}</text>
-            <text x="408" y="18" font-family="'Segoe UI', Arial, sans-serif" font-size="11" fill="#e2e8f0" text-anchor="end" font-weight="500">{percentage}%</text>
-        </g>
-        '''
-        y_offset += 34
-    
-    # Generate contribution graph (smooth curve)
-    contribution_days = stats_data.get('contribution_days', [])
-    contrib_graph = ""
-    contrib_path = ""
-    contrib_area = ""
-    x_labels = ""
-    y_labels = ""
-    
-    if contribution_days:
-        max_contributions = max([day['count'] for day in contribution_days] or [1])
-        graph_width = 380
-        graph_height = 60
-        
-        # Calculate points for the curve
-        points = []
-        num_days = len(contribution_days)
-        
-        for i, day in enumerate(contribution_days):
-            count = day['count']
-            x = (i / (num_days - 1)) * graph_width if num_days > 1 else 0
-            y = graph_height - (count / max_contributions * graph_height) if max_contributions > 0 else graph_height
-            points.append((x, y))
-        
-        # Create smooth curve path using quadratic bezier curves
-        if len(points) >= 2:
-            # Start the path
-            path_d = f"M {points[0][0]},{points[0][1]}"
-            
-            for i in range(1, len(points)):
-                # Calculate control point for smooth curve
-                if i < len(points) - 1:
-                    # Midpoint between current and next point for smooth curve
-                    cp_x = (points[i][0] + points[i-1][0]) / 2
-                    path_d += f" Q {points[i-1][0]},{points[i-1][1]} {cp_x},{points[i][1]}"
-                else:
-                    # Last point
-                    path_d += f" L {points[i][0]},{points[i][1]}"
-            
-            contrib_path = path_d
-            
-            # Create area under curve with gradient
-            area_d = path_d + f" L {graph_width},{graph_height} L 0,{graph_height} Z"
-            contrib_area = area_d
-            
-            # Create dots on the curve for visual appeal
-            contrib_dots = ""
-            for i, (x, y) in enumerate(points):
-                if i % 3 == 0:  # Show every 3rd dot to avoid clutter
-                    count = contribution_days[i]['count']
-                    contrib_dots += f'<circle cx="{x}" cy="{y}" r="2.5" fill="#39d353" opacity="0.9"><title>{count} contributions</title></circle>'
-            
-            contrib_graph = contrib_dots
-            
-            # Generate Y-axis labels (contribution counts)
-            y_step = max_contributions / 3
-            for i in range(4):
-                y_value = int(max_contributions - (i * y_step))
-                y_pos = (i * graph_height / 3)
-                y_labels += f'<text x="-5" y="{y_pos + 4}" font-family="\'Segoe UI\', Arial, sans-serif" font-size="9" fill="#718096" text-anchor="end">{y_value}</text>'
-            
-            # Generate X-axis labels (dates)
-            # Show start, middle, and end dates
-            from datetime import datetime as dt
-            if num_days >= 3:
-                for idx in [0, num_days // 2, num_days - 1]:
-                    if idx < len(contribution_days):
-                        date_str = contribution_days[idx]['date']
-                        date_obj = dt.strptime(date_str, "%Y-%m-%d")
-                        label = date_obj.strftime("%b %d")
-                        x_pos = (idx / (num_days - 1)) * graph_width if num_days > 1 else 0
-                        x_labels += f'<text x="{x_pos}" y="75" font-family="\'Segoe UI\', Arial, sans-serif" font-size="9" fill="#718096" text-anchor="middle">{label}</text>'
-    
-    lang_section_height = len(languages) * 34 + 70 if languages else 0
-    contrib_section_height = 145 if contribution_days else 0
-    svg_height = 290 + lang_section_height + contrib_section_height
-    
-    svg_content = f"""
-    <svg width="500" height="{svg_height}" xmlns="http://www.w3.org/2000/svg">
-        <defs>
-            <linearGradient id="grad" x1="0%" y1="0%" x2="100%" y2="100%">
-                <stop offset="0%" style="stop-color:#1a202c;stop-opacity:1" />
-                <stop offset="50%" style="stop-color:#2d3748;stop-opacity:1" />
-                <stop offset="100%" style="stop-color:#1a202c;stop-opacity:1" />
-            </linearGradient>
-            <linearGradient id="cardGrad" x1="0%" y1="0%" x2="100%" y2="100%">
-                <stop offset="0%" style="stop-color:rgba(255,255,255,0.1);stop-opacity:1" />
-                <stop offset="100%" style="stop-color:rgba(255,255,255,0.05);stop-opacity:1" />
-            </linearGradient>
-            <linearGradient id="areaGrad" x1="0%" y1="0%" x2="0%" y2="100%">
-                <stop offset="0%" style="stop-color:#39d353;stop-opacity:0.3" />
-                <stop offset="100%" style="stop-color:#39d353;stop-opacity:0.05" />
-            </linearGradient>
-            <filter id="shadow">
-                <feDropShadow dx="0" dy="6" stdDeviation="8" flood-opacity="0.3"/>
-            </filter>
-            <filter id="cardShadow">
-                <feDropShadow dx="0" dy="2" stdDeviation="4" flood-opacity="0.2"/>
-            </filter>
-            <filter id="glow">
-                <feGaussianBlur stdDeviation="3" result="coloredBlur"/>
-                <feMerge>
-                    <feMergeNode in="coloredBlur"/>
-                    <feMergeNode in="SourceGraphic"/>
-                </feMerge>
-            </filter>
-        </defs>
-        
-        <!-- Background -->
-        <rect width="500" height="{svg_height}" rx="16" fill="url(#grad)" filter="url(#shadow)"/>
-        
-        <!-- Decorative Elements -->
-        <circle cx="50" cy="50" r="80" fill="{grade_color}" opacity="0.03"/>
-        <circle cx="450" cy="{svg_height - 50}" r="100" fill="{grade_color}" opacity="0.02"/>
-        
-        <!-- Header Section -->
-        <text x="35" y="48" font-family="'Segoe UI', Arial, sans-serif" font-size="28" font-weight="800" fill="#ffffff" letter-spacing="-0.5">{name_display}</text>
-        <text x="35" y="73" font-family="'Segoe UI', Arial, sans-serif" font-size="15" fill="#a0aec0" font-weight="500">@{stats_data['username']}</text>
-        
-        <!-- Grade Badge -->
-        <g transform="translate(445, 40)">
-            <circle cx="0" cy="0" r="32" fill="{grade_glow}" opacity="0.15"/>
-            <circle cx="0" cy="0" r="28" fill="url(#cardGrad)" stroke="{grade_color}" stroke-width="2.5"/>
-            <text x="0" y="9" font-family="'Segoe UI', Arial, sans-serif" font-size="20" font-weight="800" fill="{grade_color}" text-anchor="middle">{grade}</text>
-        </g>
-        
-        <!-- Info Row -->
-        <g transform="translate(35, 95)">
-            <rect x="0" y="0" width="155" height="30" rx="15" fill="url(#cardGrad)" stroke="rgba(255,255,255,0.1)" stroke-width="1"/>
-            <text x="15" y="19" font-family="'Segoe UI', Arial, sans-serif" font-size="12" fill="#e2e8f0" font-weight="500">📍 {location}</text>
-        </g>
-        <g transform="translate(200, 95)">
-            <rect x="0" y="0" width="145" height="30" rx="15" fill="url(#cardGrad)" stroke="rgba(255,255,255,0.1)" stroke-width="1"/>
-            <text x="15" y="19" font-family="'Segoe UI', Arial, sans-serif" font-size="12" fill="#e2e8f0" font-weight="500">📅 {joined}</text>
-        </g>
-        
-        <!-- Stats Grid -->
-        <g transform="translate(35, 145)">
-            <!-- Public Repos -->
-            <rect width="135" height="100" rx="12" fill="url(#cardGrad)" stroke="rgba(255,255,255,0.1)" stroke-width="1" filter="url(#cardShadow)"/>
-            <text x="67.5" y="50" font-family="'Segoe UI', Arial, sans-serif" font-size="38" font-weight="800" fill="#ffffff" text-anchor="middle">{stats_data['public_repos']}</text>
-            <text x="67.5" y="73" font-family="'Segoe UI', Arial, sans-serif" font-size="11" fill="#cbd5e0" text-anchor="middle" font-weight="600">Public Repos</text>
-        </g>
-        
-        <g transform="translate(180, 145)">
-            <!-- Commits This Year -->
-            <rect width="135" height="100" rx="12" fill="url(#cardGrad)" stroke="rgba(255,255,255,0.1)" stroke-width="1" filter="url(#cardShadow)"/>
-            <text x="67.5" y="50" font-family="'Segoe UI', Arial, sans-serif" font-size="38" font-weight="800" fill="{grade_color}" text-anchor="middle" filter="url(#glow)">{stats_data['commits_this_year']}</text>
-            <text x="67.5" y="73" font-family="'Segoe UI', Arial, sans-serif" font-size="11" fill="#cbd5e0" text-anchor="middle" font-weight="600">Contributions</text>
-        </g>
-        
-        <g transform="translate(325, 145)">
-            <!-- Max Streak -->
-            <rect width="140" height="100" rx="12" fill="url(#cardGrad)" stroke="rgba(255,255,255,0.1)" stroke-width="1" filter="url(#cardShadow)"/>
-            <text x="70" y="50" font-family="'Segoe UI', Arial, sans-serif" font-size="38" font-weight="800" fill="#ff6b6b" text-anchor="middle" filter="url(#glow)">{stats_data.get('max_streak', 0)}</text>
-            <text x="70" y="73" font-family="'Segoe UI', Arial, sans-serif" font-size="11" fill="#cbd5e0" text-anchor="middle" font-weight="600">🔥 Max Streak</text>
-        </g>
-        
-        <!-- Contribution Graph Section -->
-        {f'''<g transform="translate(35, 265)">
-            <text x="0" y="0" font-family="'Segoe UI', Arial, sans-serif" font-size="18" font-weight="700" fill="#ffffff">📊 Contribution Activity</text>
-            <text x="0" y="18" font-family="'Segoe UI', Arial, sans-serif" font-size="11" fill="#a0aec0" font-weight="500">Last 90 days</text>
-        </g>
-        <g transform="translate(50, 310)">
-            <rect x="-10" y="0" width="420" height="105" rx="10" fill="rgba(255,255,255,0.02)" stroke="rgba(255,255,255,0.08)" stroke-width="1"/>
-            
-            <!-- Y-axis labels -->
-            <g transform="translate(0, 15)">
-                {y_labels}
-            </g>
-            
-            <!-- Graph area -->
-            <g transform="translate(10, 15)">
-                <!-- Grid lines -->
-                <line x1="0" y1="15" x2="380" y2="15" stroke="rgba(255,255,255,0.05)" stroke-width="1" stroke-dasharray="4,4"/>
-                <line x1="0" y1="30" x2="380" y2="30" stroke="rgba(255,255,255,0.05)" stroke-width="1" stroke-dasharray="4,4"/>
-                <line x1="0" y1="45" x2="380" y2="45" stroke="rgba(255,255,255,0.05)" stroke-width="1" stroke-dasharray="4,4"/>
-                <line x1="0" y1="60" x2="380" y2="60" stroke="rgba(255,255,255,0.08)" stroke-width="1"/>
-                
-                <!-- Y-axis line -->
-                <line x1="0" y1="0" x2="0" y2="60" stroke="rgba(255,255,255,0.15)" stroke-width="1.5"/>
-                <!-- X-axis line -->
-                <line x1="0" y1="60" x2="380" y2="60" stroke="rgba(255,255,255,0.15)" stroke-width="1.5"/>
-                
-                <!-- Area under curve -->
-                <path d="{contrib_area}" fill="url(#areaGrad)"/>
-                
-                <!-- Curve line -->
-                <path d="{contrib_path}" fill="none" stroke="#39d353" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
-                    <animate attributeName="stroke-dashoffset" from="1000" to="0" dur="1.5s" fill="freeze"/>
-                </path>
-                
-                <!-- Data points -->
-                {contrib_graph}
-                
-                <!-- X-axis labels -->
-                {x_labels}
-            </g>
-        </g>''' if contribution_days else ''}
-        
-        <!-- Languages Section -->
-        {f'''<g transform="translate(35, {285 + contrib_section_height})">
-            <text x="0" y="0" font-family="'Segoe UI', Arial, sans-serif" font-size="18" font-weight="700" fill="#ffffff">💻 Most Used Languages</text>
-        </g>
-        <g transform="translate(40, {315 + contrib_section_height})">
-            {lang_bars}
-        </g>''' if languages else ''}
-    </svg>
-    """
-    return Response(content=svg_content, media_type="image/svg+xml")
\ No newline at end of file
+    return card_response(stats_data, if_none_match, accept_encoding, {"hide": sorted(hidden)} if hidden else None)
+
+@app.get("/org/stats")
+async def org_stats(org: str):
+    try:
+        org_data = await load_org_stats(org)
+    except httpx.HTTPError:
+        return Response(content="GitHub API error", status_code=502)
+    if org_data is None:
+        return Response(content="Organization not found", status_code=404)
+    return org_data
+
+@app.get("/org/stats/svg")
+async def org_stats_svg(org: str, if_none_match: str = Header(None), accept_encoding: str = Header(None)):
+    try:
+        org_data = await load_org_stats(org)
+    except httpx.HTTPError:
+        return Response(content="GitHub API error", status_code=502)
+    if org_data is None:
+        return Response(content="Organization not found", status_code=404)
+    return card_response(org_card(org_data), if_none_match, accept_encoding)
\ No newline at end of file
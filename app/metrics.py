@@ -0,0 +1,173 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Histogram bucket upper bounds in seconds, shared by every latency series
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# {name: [seconds, count]} for the request being served, read into its Server-Timing header
+_timings = ContextVar("timings", default=None)
+
+def _labels(names: tuple, values: tuple) -> str:
+    pairs = ",".join(f'{name}="{value}"' for name, value in zip(names, values))
+    return "{" + pairs + "}" if pairs else ""
+
+class Histogram:
+    """A Prometheus histogram with one series per label value."""
+
+    def __init__(self, name: str, help: str, label: str):
+        self.name = name
+        self.help = help
+        self.label = label
+        self._series = {}
+
+    def observe(self, value: str, seconds: float):
+        series = self._series.setdefault(value, {"buckets": [0] * len(BUCKETS), "sum": 0.0, "count": 0})
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                series["buckets"][i] += 1
+        series["sum"] += seconds
+        series["count"] += 1
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for value, series in sorted(self._series.items()):
+            for bound, count in zip(BUCKETS, series["buckets"]):
+                lines.append(f'{self.name}_bucket{{{self.label}="{value}",le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{self.label}="{value}",le="+Inf"}} {series["count"]}')
+            lines.append(f'{self.name}_sum{{{self.label}="{value}"}} {series["sum"]:.6f}')
+            lines.append(f'{self.name}_count{{{self.label}="{value}"}} {series["count"]}')
+        return lines
+
+class Counter:
+    """A Prometheus counter keyed by a tuple of label values."""
+
+    def __init__(self, name: str, help: str, labels: tuple):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values = {}
+
+    def inc(self, *values):
+        self._values[values] = self._values.get(values, 0) + 1
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for values, count in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labels, values)} {count}")
+        return lines
+
+def gauge(name: str, help: str, samples, kind: str = "gauge") -> list:
+    """Exposition lines for a value read at scrape time; samples are (labels dict, value).
+
+    Pass kind="counter" for totals another module already keeps.
+    """
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(tuple(labels), tuple(labels.values()))} {value}")
+    return lines
+
+request_seconds = Histogram("github_stats_request_seconds", "Time to serve a request, by route.", "route")
+phase_seconds = Histogram("github_stats_phase_seconds", "Time spent in each phase of building a response.", "phase")
+upstream_seconds = Histogram(
+    "github_stats_upstream_seconds", "GitHub API response time (to headers), by endpoint kind.", "kind"
+)
+upstream_responses = Counter(
+    "github_stats_upstream_responses_total", "GitHub API responses by endpoint kind and status code.", ("kind", "status")
+)
+
+def _add(name: str, seconds: float):
+    timings = _timings.get()
+    if timings is not None:
+        entry = timings.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+@contextmanager
+def timed(phase: str):
+    """Time a block as `phase` in the phase histogram and the current request's Server-Timing."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        phase_seconds.observe(phase, seconds)
+        _add(phase, seconds)
+
+def upstream_kind(path: str) -> str:
+    """Group a GitHub API path into the endpoint kinds the stats fetch from."""
+    if path == "/graphql":
+        return "graphql"
+    if path.endswith("/languages"):
+        return "languages"
+    if path.endswith("/repos"):
+        return "repos"
+    if path.endswith("/members"):
+        return "members"
+    if path.startswith("/orgs/"):
+        return "org"
+    return "user"
+
+def record_upstream(kind: str, status: int, seconds: float):
+    """Count one GitHub API response; its time also shows in Server-Timing as gh-<kind>."""
+    upstream_seconds.observe(kind, seconds)
+    upstream_responses.inc(kind, str(status))
+    _add(f"gh-{kind}", seconds)
+
+def server_timing(timings: dict) -> str:
+    """Format {name: [seconds, count]} as a Server-Timing header value.
+
+    Upstream entries sum overlapping calls, so their desc gives the call count.
+    """
+    entries = []
+    for name, (seconds, count) in timings.items():
+        entry = f"{name};dur={seconds * 1000:.1f}"
+        if name.startswith("gh-"):
+            entry += f';desc="{count} call{"s" if count != 1 else ""}"'
+        entries.append(entry)
+    return ", ".join(entries)
+
+class ServerTimingMiddleware:
+    """ASGI middleware that times each request and reports its phases in a Server-Timing header.
+
+    Work done for a request, including the tasks it spawns, adds to the
+    request's timings; requests that join another's in-flight fetch only
+    see their own wait.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = {}
+        token = _timings.set(timings)
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                timings["total"] = [time.perf_counter() - start, 1]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(timings).encode("latin-1")))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _timings.reset(token)
+            # Route templates, not raw paths, keep the label set bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            request_seconds.observe(route, time.perf_counter() - start)
+
+def render(*sections) -> str:
+    """The request, phase and upstream series followed by scrape-time gauge sections."""
+    lines = []
+    for metric in (request_seconds, phase_seconds, upstream_seconds, upstream_responses):
+        lines.extend(metric.render())
+    for section in sections:
+        lines.extend(section)
+    return "\n".join(lines) + "\n"
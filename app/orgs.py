@@ -0,0 +1,171 @@
+import asyncio
+import heapq
+import os
+import httpx
+from .http_client import TIMEOUTS, get_client
+from .etag_store import etag_store
+from .tokens import token_pool
+from .github import (
+    LANGUAGE_CONCURRENCY, calculate_grade, fetch_contribution_days, fetch_rest_language_totals, iter_pages,
+    top_languages, year_to_date
+)
+from .batch import batch_limiter, iter_batch_stats
+from . import analytics
+
+# Members beyond this many are not aggregated (the response says so)
+ORG_MAX_MEMBERS = int(os.getenv("ORG_MAX_MEMBERS", "500"))
+
+# (lowest max streak, label) buckets for the streak distribution
+STREAK_BUCKETS = ((30, "30+"), (7, "7-29"), (1, "1-6"), (0, "0"))
+
+async def _fetch_org(client: httpx.AsyncClient, org: str, headers: dict):
+    """Fetch the organization profile, or None if it does not exist."""
+    response = await etag_store.get(client, f"https://api.github.com/orgs/{org}", headers, TIMEOUTS["user"])
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()
+
+async def _list_members(client: httpx.AsyncClient, org: str, headers: dict, concurrency: int):
+    """Logins of the org's members (public ones, unless the token belongs to a member), and the full count."""
+    members = []
+    pages = iter_pages(client, f"https://api.github.com/orgs/{org}/members?per_page=100", headers,
+                       asyncio.Semaphore(concurrency))
+    async for page in pages:
+        members.extend(member["login"] for member in page)
+    return members[:ORG_MAX_MEMBERS], len(members)
+
+async def get_member_activity(username: str, client: httpx.AsyncClient = None):
+    """One member's contribution summary for the org aggregate.
+
+    The contribution store only requests days that are not stored yet, so a
+    member whose calendar has not changed costs one tiny query.
+    """
+    try:
+        contribution_days = await fetch_contribution_days(client or get_client(), username, {})
+    except httpx.HTTPError:
+        return None
+    activity = analytics.summarize(contribution_days)
+    return {
+        "total": year_to_date(contribution_days),
+        "active_days": activity["active_days"],
+        "max_streak": activity["max_streak"],
+        "current_streak": activity["current_streak"],
+        "contribution_days": contribution_days[-90:]
+    }
+
+async def get_org_stats(org: str, load_member, github_token: str = None, client: httpx.AsyncClient = None,
+                        concurrency: int = None):
+    """Aggregate stats over an organization's members and repositories.
+
+    `load_member(username)` returns a member's get_member_activity summary,
+    typically through a cache, so a refresh reuses members fetched recently.
+    Members are folded into the totals one at a time as they arrive, so
+    memory does not grow with the size of the org.
+
+    Returns None only if the org does not exist; raises httpx.HTTPError if
+    its profile cannot be fetched. A failed repo or member listing leaves
+    the languages or member aggregates empty (`members_complete` is false).
+    """
+    headers = {}
+    if github_token:
+        headers["Authorization"] = f"token {github_token}"
+    # Contribution calendars need GraphQL, which needs a token
+    authenticated = bool(github_token) or token_pool.has_tokens()
+    client = client or get_client()
+    concurrency = concurrency or LANGUAGE_CONCURRENCY
+
+    data = await _fetch_org(client, org, headers)
+    if data is None:
+        return None
+
+    async def org_languages():
+        try:
+            return await fetch_rest_language_totals(client, f"org:{org.lower()}", repos_url, headers, concurrency)
+        except httpx.HTTPError:
+            return {}, {}
+
+    async def member_listing():
+        # A failed member listing leaves the org stats without member aggregates
+        try:
+            return await _list_members(client, org, headers, concurrency)
+        except httpx.HTTPError:
+            return None
+
+    repos_url = f"https://api.github.com/orgs/{org}/repos?per_page=100"
+    (languages, colors), listing = await asyncio.gather(org_languages(), member_listing())
+    members_complete = listing is not None
+    members, member_count = listing if members_complete else ([], 0)
+
+    total = 0
+    active_members = 0
+    failed = 0
+    max_streak = 0
+    streak_distribution = {label: 0 for _, label in reversed(STREAK_BUCKETS)}
+    daily = {}
+    top = []  # min-heap of (total, login), the 10 largest contributors
+
+    if authenticated:
+        async def load(username, profile):
+            # Members share the process-wide batch budget with /stats/batch
+            async with batch_limiter():
+                return await load_member(username)
+
+        # Members need no profiles, so none count as uncached (which would prefetch them)
+        async for result in iter_batch_stats(members, load, lambda username: True, concurrency):
+            if "error" in result:
+                failed += 1
+                continue
+            activity = result["stats"]
+            total += activity["total"]
+            max_streak = max(max_streak, activity["max_streak"])
+            if activity["active_days"]:
+                active_members += 1
+            for lowest, label in STREAK_BUCKETS:
+                if activity["max_streak"] >= lowest:
+                    streak_distribution[label] += 1
+                    break
+            for day in activity["contribution_days"]:
+                daily[day["date"]] = daily.get(day["date"], 0) + day["count"]
+            heapq.heappush(top, (activity["total"], result["username"]))
+            if len(top) > 10:
+                heapq.heappop(top)
+
+    return {
+        "org": data.get("login"),
+        "name": data.get("name"),
+        "description": data.get("description"),
+        "location": data.get("location"),
+        "created_at": data.get("created_at"),
+        "avatar_url": data.get("avatar_url"),
+        "public_repos": data.get("public_repos", 0),
+        "followers": data.get("followers", 0),
+        "members": member_count,
+        "members_aggregated": len(members) - failed if authenticated else 0,
+        "members_complete": members_complete,
+        "contributions_this_year": total,
+        "active_members": active_members,
+        "max_streak": max_streak,
+        "streak_distribution": streak_distribution,
+        "top_contributors": [
+            {"username": username, "contributions": contributions}
+            for contributions, username in sorted(top, reverse=True)
+        ],
+        "contribution_days": [{"date": date, "count": daily[date]} for date in sorted(daily)],
+        "languages": top_languages(languages, colors)
+    }
+
+def org_card(org_stats: dict) -> dict:
+    """Shape org stats like user stats so the org is drawn with the same card."""
+    return {
+        "username": org_stats["org"],
+        "name": org_stats["name"],
+        "location": org_stats["location"],
+        "created_at": org_stats["created_at"],
+        "public_repos": org_stats["public_repos"],
+        "commits_this_year": org_stats["contributions_this_year"],
+        "max_streak": org_stats["max_streak"],
+        "grade": calculate_grade(org_stats["public_repos"], org_stats["followers"], org_stats["contributions_this_year"]),
+        "contribution_days": org_stats["contribution_days"],
+        "languages": org_stats["languages"]
+    }
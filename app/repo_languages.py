@@ -0,0 +1,95 @@
+import asyncio
+import os
+from collections import OrderedDict
+
+# Number of users whose per-repo language breakdowns are kept in memory
+REPO_LANGUAGE_CACHE_MAX_USERS = int(os.getenv("REPO_LANGUAGE_CACHE_MAX_USERS", "1000"))
+
+class RepoLanguageCache:
+    """Per-repo language bytes keyed by full_name and validated against pushed_at.
+
+    Each user keeps running language totals that are adjusted repo by repo,
+    so a refresh only refetches repos pushed since the last aggregation.
+    """
+
+    def __init__(self, max_users: int):
+        self.max_users = max_users
+        self._users = OrderedDict()  # username -> {"repos": {full_name: (pushed_at, languages)}, "totals": {...}}
+        self.reused = 0
+        self.refetched = 0
+
+    def _state(self, username: str) -> dict:
+        state = self._users.get(username)
+        if state is None:
+            state = {"repos": {}, "totals": {}}
+            self._users[username] = state
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        self._users.move_to_end(username)
+        return state
+
+    @staticmethod
+    def _add(totals: dict, languages: dict, sign: int):
+        for lang, bytes_count in languages.items():
+            total = totals.get(lang, 0) + sign * bytes_count
+            if total > 0:
+                totals[lang] = total
+            else:
+                totals.pop(lang, None)
+
+    async def aggregate(self, username: str, repo_pages, fetch) -> dict:
+        """Return language totals over the repos in `repo_pages`, refetching only changed repos.
+
+        `repo_pages` is an async iterable of repo lists; fetches start as each
+        page arrives and only repo names are kept, so memory stays flat however
+        many repos the user has. `fetch(repo)` returns the repo's
+        {language: bytes} dict, or None if it could not be read (the repo is
+        then retried on the next aggregation).
+        """
+        known = self._state(username)["repos"]
+        seen = set()
+        pending = []  # (full_name, pushed_at, task)
+
+        try:
+            async for repos in repo_pages:
+                for repo in repos:
+                    name = repo["full_name"]
+                    seen.add(name)
+                    if name in known and known[name][0] == repo.get("pushed_at"):
+                        self.reused += 1
+                        continue
+                    self.refetched += 1
+                    pending.append((name, repo.get("pushed_at"), asyncio.ensure_future(fetch(repo))))
+
+            results = await asyncio.gather(*(task for _, _, task in pending))
+        except BaseException:
+            # An incomplete listing must not look like deleted repos
+            for _, _, task in pending:
+                task.cancel()
+            raise
+
+        # Apply every update without awaiting so concurrent aggregations cannot interleave
+        state = self._state(username)
+        for name in [name for name in state["repos"] if name not in seen]:
+            self._add(state["totals"], state["repos"].pop(name)[1], -1)
+
+        for (name, pushed_at, _), languages in zip(pending, results):
+            if languages is None:
+                continue
+            if name in state["repos"]:
+                self._add(state["totals"], state["repos"][name][1], -1)
+            self._add(state["totals"], languages, 1)
+            state["repos"][name] = (pushed_at, languages)
+
+        return dict(state["totals"])
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._users),
+            "repos": sum(len(state["repos"]) for state in self._users.values()),
+            "reused": self.reused,
+            "refetched": self.refetched
+        }
+
+# Per-repo language breakdowns for the REST languages_url fan-out
+repo_language_cache = RepoLanguageCache(REPO_LANGUAGE_CACHE_MAX_USERS)
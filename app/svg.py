@@ -1,3 +1,389 @@
+import hashlib
+import json
+import re
+from datetime import date
+from html import escape
+
+# Everything that does not depend on the user is built once at import; a card
+# render only fills the dynamic slots and joins the parts a single time.
+
+FONT = "'Segoe UI', Arial, sans-serif"
+
+# Linguist colors for common languages; others use the color GitHub reports
+LANG_COLORS = {
+    "Python": "#3572A5",
+    "JavaScript": "#f1e05a",
+    "TypeScript": "#2b7489",
+    "Java": "#b07219",
+    "C++": "#f34b7d",
+    "C": "#555555",
+    "C#": "#178600",
+    "Go": "#00ADD8",
+    "Rust": "#dea584",
+    "Ruby": "#701516",
+    "PHP": "#4F5D95",
+    "HTML": "#e34c26",
+    "CSS": "#563d7c",
+    "Shell": "#89e051",
+    "Dart": "#00B4AB",
+    "Kotlin": "#A97BFF",
+    "Swift": "#ffac45"
+}
+DEFAULT_LANG_COLOR = "#858585"
+
+# Grade letter -> (color, glow)
+GRADE_COLORS = {
+    "S": ("#FFD700", "#FFA500"),
+    "A": ("#C0C0C0", "#A8A8A8"),
+    "B": ("#CD7F32", "#B87333")
+}
+DEFAULT_GRADE_COLORS = ("#718096", "#4A5568")
+
+# Part of every card hash; bump whenever the rendered markup changes so
+# clients and CDNs holding the old ETag pick up the new card
+CARD_VERSION = 4
+
+GRAPH_WIDTH = 380
+GRAPH_HEIGHT = 60
+LANG_BAR_WIDTH = 420
+LANG_ROW_HEIGHT = 34
+
+# At most one curve point per ~4px; longer ranges are downsampled with LTTB
+CURVE_MAX_POINTS = GRAPH_WIDTH // 4
+
+def _minify(markup: str) -> str:
+    """Drop comments and the whitespace between tags; templates are minified once at import."""
+    markup = re.sub(r"<!--.*?-->", "", markup, flags=re.S)
+    return re.sub(r">\s+<", "><", markup).strip()
+
+# Attributes shared by many elements live in one style block instead of being
+# repeated on every element
+_STYLE = (
+    "<style>"
+    f"text{{font-family:{FONT}}}"
+    ".card{fill:url(#cardGrad);stroke:rgba(255,255,255,0.1);stroke-width:1}"
+    ".info{font-size:12px;fill:#e2e8f0;font-weight:500}"
+    ".val{font-size:38px;font-weight:800;text-anchor:middle}"
+    ".key{font-size:11px;fill:#cbd5e0;text-anchor:middle;font-weight:600}"
+    ".head{font-size:18px;font-weight:700;fill:#ffffff}"
+    ".grid{stroke:rgba(255,255,255,0.05);stroke-width:1;stroke-dasharray:4,4}"
+    ".axis{stroke:rgba(255,255,255,0.15);stroke-width:1.5}"
+    ".lbl{font-size:9px;fill:#718096}"
+    ".dot{fill:#39d353;opacity:0.9}"
+    ".track{fill:rgba(255,255,255,0.05)}"
+    ".lname{font-size:12px;fill:#ffffff;font-weight:600}"
+    ".lpct{font-size:11px;fill:#e2e8f0;text-anchor:end;font-weight:500}"
+    "</style>"
+)
+
+_DEFS = _STYLE + _minify("""
+        <defs>
+            <linearGradient id="grad" x1="0%" y1="0%" x2="100%" y2="100%">
+                <stop offset="0%" style="stop-color:#1a202c;stop-opacity:1" />
+                <stop offset="50%" style="stop-color:#2d3748;stop-opacity:1" />
+                <stop offset="100%" style="stop-color:#1a202c;stop-opacity:1" />
+            </linearGradient>
+            <linearGradient id="cardGrad" x1="0%" y1="0%" x2="100%" y2="100%">
+                <stop offset="0%" style="stop-color:rgba(255,255,255,0.1);stop-opacity:1" />
+                <stop offset="100%" style="stop-color:rgba(255,255,255,0.05);stop-opacity:1" />
+            </linearGradient>
+            <linearGradient id="areaGrad" x1="0%" y1="0%" x2="0%" y2="100%">
+                <stop offset="0%" style="stop-color:#39d353;stop-opacity:0.3" />
+                <stop offset="100%" style="stop-color:#39d353;stop-opacity:0.05" />
+            </linearGradient>
+            <filter id="shadow">
+                <feDropShadow dx="0" dy="6" stdDeviation="8" flood-opacity="0.3"/>
+            </filter>
+            <filter id="cardShadow">
+                <feDropShadow dx="0" dy="2" stdDeviation="4" flood-opacity="0.2"/>
+            </filter>
+            <filter id="glow">
+                <feGaussianBlur stdDeviation="3" result="coloredBlur"/>
+                <feMerge>
+                    <feMergeNode in="coloredBlur"/>
+                    <feMergeNode in="SourceGraphic"/>
+                </feMerge>
+            </filter>
+        </defs>""")
+
+# Templates are bound str.format methods, so each slot fill is a single call
+_OPEN = '<svg width="500" height="{0}" xmlns="http://www.w3.org/2000/svg">'.format
+
+_BACKGROUND = _minify("""
+        <!-- Background -->
+        <rect width="500" height="{0}" rx="16" fill="url(#grad)" filter="url(#shadow)"/>
+
+        <!-- Decorative Elements -->
+        <circle cx="50" cy="50" r="80" fill="{1}" opacity="0.03"/>
+        <circle cx="450" cy="{2}" r="100" fill="{1}" opacity="0.02"/>""").format
+
+_PROFILE = _minify("""
+        <!-- Header Section -->
+        <text x="35" y="48" font-size="28" font-weight="800" fill="#ffffff" letter-spacing="-0.5">{name}</text>
+        <text x="35" y="73" font-size="15" fill="#a0aec0" font-weight="500">@{username}</text>
+
+        <!-- Grade Badge -->
+        <g transform="translate(445, 40)">
+            <circle cx="0" cy="0" r="32" fill="{grade_glow}" opacity="0.15"/>
+            <circle cx="0" cy="0" r="28" fill="url(#cardGrad)" stroke="{grade_color}" stroke-width="2.5"/>
+            <text x="0" y="9" font-size="20" font-weight="800" fill="{grade_color}" text-anchor="middle">{grade}</text>
+        </g>
+
+        <!-- Info Row -->
+        <g transform="translate(35, 95)">
+            <rect class="card" x="0" y="0" width="155" height="30" rx="15"/>
+            <text class="info" x="15" y="19">📍 {location}</text>
+        </g>
+        <g transform="translate(200, 95)">
+            <rect class="card" x="0" y="0" width="145" height="30" rx="15"/>
+            <text class="info" x="15" y="19">📅 {joined}</text>
+        </g>
+
+        <!-- Stats Grid -->
+        <g transform="translate(35, 145)">
+            <!-- Public Repos -->
+            <rect class="card" width="135" height="100" rx="12" filter="url(#cardShadow)"/>
+            <text class="val" x="67.5" y="50" fill="#ffffff">{public_repos}</text>
+            <text class="key" x="67.5" y="73">Public Repos</text>
+        </g>
+
+        <g transform="translate(180, 145)">
+            <!-- Commits This Year -->
+            <rect class="card" width="135" height="100" rx="12" filter="url(#cardShadow)"/>
+            <text class="val" x="67.5" y="50" fill="{grade_color}" filter="url(#glow)">{commits}</text>
+            <text class="key" x="67.5" y="73">Contributions</text>
+        </g>
+
+        <g transform="translate(325, 145)">
+            <!-- Max Streak -->
+            <rect class="card" width="140" height="100" rx="12" filter="url(#cardShadow)"/>
+            <text class="val" x="70" y="50" fill="#ff6b6b" filter="url(#glow)">{max_streak}</text>
+            <text class="key" x="70" y="73">🔥 Max Streak</text>
+        </g>""").format
+
+_CONTRIB_OPEN = _minify("""
+        <!-- Contribution Graph Section -->
+        <g transform="translate(35, 265)">
+            <text class="head" x="0" y="0">📊 Contribution Activity</text>
+            <text x="0" y="18" font-size="11" fill="#a0aec0" font-weight="500">Last 90 days</text>
+        </g>
+        <g transform="translate(50, 310)">
+            <rect x="-10" y="0" width="420" height="105" rx="10" fill="rgba(255,255,255,0.02)" stroke="rgba(255,255,255,0.08)" stroke-width="1"/>
+
+            <!-- Y-axis labels -->
+            <g transform="translate(0, 15)">""")
+
+_GRID = _minify(f"""
+            </g>
+
+            <!-- Graph area -->
+            <g transform="translate(10, 15)">
+                <!-- Grid lines -->
+                <line class="grid" x1="0" y1="15" x2="{GRAPH_WIDTH}" y2="15"/>
+                <line class="grid" x1="0" y1="30" x2="{GRAPH_WIDTH}" y2="30"/>
+                <line class="grid" x1="0" y1="45" x2="{GRAPH_WIDTH}" y2="45"/>
+                <line x1="0" y1="{GRAPH_HEIGHT}" x2="{GRAPH_WIDTH}" y2="{GRAPH_HEIGHT}" stroke="rgba(255,255,255,0.08)" stroke-width="1"/>
+
+                <!-- Y-axis line -->
+                <line class="axis" x1="0" y1="0" x2="0" y2="{GRAPH_HEIGHT}"/>
+                <!-- X-axis line -->
+                <line class="axis" x1="0" y1="{GRAPH_HEIGHT}" x2="{GRAPH_WIDTH}" y2="{GRAPH_HEIGHT}"/>
+""")
+
+_CURVE = _minify("""
+                <!-- Area under curve -->
+                <path d="{0}" fill="url(#areaGrad)"/>
+
+                <!-- Curve line -->
+                <path d="{1}" fill="none" stroke="#39d353" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round">
+                    <animate attributeName="stroke-dashoffset" from="1000" to="0" dur="1.5s" fill="freeze"/>
+                </path>""").format
+
+_CONTRIB_CLOSE = "</g></g>"
+
+_Y_LABEL = '<text class="lbl" x="-5" y="{0}" text-anchor="end">{1}</text>'.format
+_X_LABEL = '<text class="lbl" x="{0}" y="75" text-anchor="middle">{1}</text>'.format
+_DOT = '<circle class="dot" cx="{0}" cy="{1}" r="2.5"><title>{2} contributions</title></circle>'.format
+
+_LANG_OPEN = _minify("""
+        <!-- Languages Section -->
+        <g transform="translate(35, {0})">
+            <text class="head" x="0" y="0">💻 Most Used Languages</text>
+        </g>
+        <g transform="translate(40, {1})">""").format
+
+_LANG_BAR = _minify(f"""
+        <g transform="translate(0, {{0}})">
+            <rect class="track" x="0" y="0" width="{LANG_BAR_WIDTH}" height="28" rx="6"/>
+            <rect x="2" y="2" width="{{1}}" height="24" rx="5" fill="{{2}}" opacity="0.9">
+                <animate attributeName="width" from="0" to="{{1}}" dur="1s" fill="freeze"/>
+            </rect>
+            <text class="lname" x="14" y="18">{{3}}</text>
+            <text class="lpct" x="408" y="18">{{4}}%</text>
+        </g>""").format
+
+_LANG_CLOSE = "</g>"
+
+_PARTIAL = '<text class="lbl" x="470" y="{0}" text-anchor="end">Partial data, still loading</text>'.format
+
+_CLOSE = "</svg>"
+
+def _joined(created_at: str) -> str:
+    if not created_at:
+        return "Unknown"
+    return date.fromisoformat(created_at[:10]).strftime("%b %Y")
+
+def _coord(value: float) -> str:
+    """Format a coordinate to one decimal, dropping a trailing ".0" (4.2222 -> "4.2", 60.0 -> "60")."""
+    text = f"{value:.1f}"
+    return text[:-2] if text.endswith(".0") else text
+
+def lttb(points: list, threshold: int) -> list:
+    """Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the curve's shape.
+
+    The first and last points are always kept; from each bucket in between
+    the point forming the largest triangle with the previously kept point and
+    the next bucket's average is chosen, so peaks and dips survive.
+    """
+    num_points = len(points)
+    if threshold >= num_points or threshold < 3:
+        return list(range(num_points))
+
+    bucket_size = (num_points - 2) / (threshold - 2)
+    selected = [0]
+    anchor = 0
+    for bucket in range(threshold - 2):
+        # Average of the next bucket (the last point for the final bucket)
+        next_start = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, num_points)
+        next_points = points[next_start:next_end]
+        avg_x = sum(x for x, _ in next_points) / len(next_points)
+        avg_y = sum(y for _, y in next_points) / len(next_points)
+
+        anchor_x, anchor_y = points[anchor]
+        best_area = -1.0
+        for i in range(int(bucket * bucket_size) + 1, next_start):
+            x, y = points[i]
+            area = abs((anchor_x - avg_x) * (y - anchor_y) - (anchor_x - x) * (avg_y - anchor_y))
+            if area > best_area:
+                best_area = area
+                anchor = i
+        selected.append(anchor)
+
+    selected.append(num_points - 1)
+    return selected
+
+def _contribution_parts(contribution_days: list) -> list:
+    """Axis labels, area/curve paths and data points for the contribution graph."""
+    counts = [day["count"] for day in contribution_days]
+    max_contributions = max(counts)
+    num_days = len(counts)
+    points = [
+        (
+            i / (num_days - 1) * GRAPH_WIDTH if num_days > 1 else 0,
+            GRAPH_HEIGHT - count / max_contributions * GRAPH_HEIGHT if max_contributions > 0 else GRAPH_HEIGHT
+        )
+        for i, count in enumerate(counts)
+    ]
+
+    parts = [_CONTRIB_OPEN]
+    if num_days < 2:
+        parts.append(_GRID)
+        parts.append(_CURVE("", ""))
+        parts.append(_CONTRIB_CLOSE)
+        return parts
+
+    # Y-axis labels (contribution counts)
+    y_step = max_contributions / 3
+    parts.extend(
+        _Y_LABEL(_coord(i * GRAPH_HEIGHT / 3 + 4), int(max_contributions - i * y_step))
+        for i in range(4)
+    )
+    parts.append(_GRID)
+
+    # Long ranges are thinned to the graph's pixel density before drawing
+    kept = lttb(points, CURVE_MAX_POINTS)
+    xs = [_coord(points[i][0]) for i in kept]
+    ys = [_coord(points[i][1]) for i in kept]
+
+    # Smooth curve: a quadratic segment per point, a straight line into the last one
+    segments = [f"M {xs[0]},{ys[0]}"]
+    for k in range(1, len(kept) - 1):
+        control_x = _coord((points[kept[k]][0] + points[kept[k - 1]][0]) / 2)
+        segments.append(f"Q {xs[k - 1]},{ys[k - 1]} {control_x},{ys[k]}")
+    segments.append(f"L {xs[-1]},{ys[-1]}")
+    path_d = " ".join(segments)
+    parts.append(_CURVE(f"{path_d} L {GRAPH_WIDTH},{GRAPH_HEIGHT} L 0,{GRAPH_HEIGHT} Z", path_d))
+
+    # Every 3rd point gets a dot to avoid clutter
+    parts.extend(_DOT(xs[k], ys[k], counts[kept[k]]) for k in range(0, len(kept), 3))
+
+    # X-axis labels: start, middle and end dates
+    if num_days >= 3:
+        for idx in (0, num_days // 2, num_days - 1):
+            label = date.fromisoformat(contribution_days[idx]["date"]).strftime("%b %d")
+            parts.append(_X_LABEL(_coord(points[idx][0]), label))
+
+    parts.append(_CONTRIB_CLOSE)
+    return parts
+
+def card_hash(stats_data: dict, options: dict = None) -> str:
+    """Content hash of everything a rendered card depends on."""
+    payload = json.dumps([CARD_VERSION, stats_data, options], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+def render_stats_card(stats_data: dict, options: dict = None) -> str:
+    """Render the stats card SVG for a get_user_stats result.
+
+    `options` may hold "hide", a list of sections ("languages",
+    "contributions") left off the card.
+    """
+    hide = (options or {}).get("hide", ())
+    grade = stats_data["grade"]
+    grade_color, grade_glow = GRADE_COLORS.get(grade[:1], DEFAULT_GRADE_COLORS)
+    languages = [] if "languages" in hide else stats_data.get("languages") or []
+    contribution_days = [] if "contributions" in hide else stats_data.get("contribution_days") or []
+
+    lang_section_height = len(languages) * LANG_ROW_HEIGHT + 70 if languages else 0
+    contrib_section_height = 145 if contribution_days else 0
+    svg_height = 290 + lang_section_height + contrib_section_height
+
+    parts = [
+        _OPEN(svg_height),
+        _DEFS,
+        _BACKGROUND(svg_height, grade_color, svg_height - 50),
+        _PROFILE(
+            name=escape(stats_data.get("name") or stats_data["username"]),
+            username=escape(stats_data["username"]),
+            grade=grade,
+            grade_color=grade_color,
+            grade_glow=grade_glow,
+            location=escape(stats_data.get("location") or "Not set"),
+            joined=_joined(stats_data.get("created_at")),
+            public_repos=stats_data["public_repos"],
+            commits=stats_data["commits_this_year"],
+            max_streak=stats_data.get("max_streak", 0)
+        )
+    ]
+
+    if contribution_days:
+        parts.extend(_contribution_parts(contribution_days))
+
+    if languages:
+        parts.append(_LANG_OPEN(285 + contrib_section_height, 315 + contrib_section_height))
+        for i, lang_data in enumerate(languages):
+            name = lang_data["name"]
+            percentage = lang_data["percentage"]
+            color = LANG_COLORS.get(name) or lang_data.get("color") or DEFAULT_LANG_COLOR
+            parts.append(_LANG_BAR(i * LANG_ROW_HEIGHT, _coord(percentage / 100 * LANG_BAR_WIDTH), color, escape(name), percentage))
+        parts.append(_LANG_CLOSE)
+
+    if stats_data.get("partial"):
+        parts.append(_PARTIAL(svg_height - 12))
+
+    parts.append(_CLOSE)
+    return "".join(parts)
+
 def generate_svg(username: str, repos: int, followers: int):
     return f"""
 <svg width="380" height="140" viewBox="0 0 380 140"
@@ -0,0 +1,159 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+import httpx
+from . import deadline
+
+# Default budgets until GitHub reports the real ones
+DEFAULT_LIMITS = {"core": 5000, "graphql": 5000}
+
+# When every token is drained, wait up to this many seconds for a reset
+# before degrading to unauthenticated requests
+TOKEN_POOL_MAX_WAIT = float(os.getenv("GITHUB_TOKEN_POOL_MAX_WAIT", "5.0"))
+
+# Requests kept in reserve on each token so concurrent calls don't overdraw it
+TOKEN_POOL_RESERVE = int(os.getenv("GITHUB_TOKEN_POOL_RESERVE", "10"))
+
+def _load_tokens() -> list:
+    """Read tokens from GITHUB_TOKENS (comma-separated) and GITHUB_TOKEN."""
+    tokens = [token.strip() for token in os.getenv("GITHUB_TOKENS", "").split(",") if token.strip()]
+    single = os.getenv("GITHUB_TOKEN")
+    if single and single not in tokens:
+        tokens.append(single)
+    return tokens
+
+class TokenPool:
+    """Route each upstream call to the token with the most rate-limit headroom."""
+
+    def __init__(self, tokens: list):
+        self._budgets = {
+            token: {
+                kind: {"limit": limit, "remaining": limit, "reset": 0.0}
+                for kind, limit in DEFAULT_LIMITS.items()
+            }
+            for token in tokens
+        }
+        self._disabled = set()
+        self.waits = 0
+        self.degraded = 0
+
+    def has_tokens(self) -> bool:
+        return len(self._budgets) > len(self._disabled)
+
+    def _headroom(self, token: str, kind: str, now: float) -> int:
+        budget = self._budgets[token][kind]
+        if budget["reset"] and budget["reset"] <= now:
+            # The window has rolled over since GitHub last reported
+            return budget["limit"]
+        return budget["remaining"] - TOKEN_POOL_RESERVE
+
+    async def acquire(self, kind: str):
+        """Return the token with the most headroom for kind, or None to go unauthenticated."""
+        candidates = [token for token in self._budgets if token not in self._disabled]
+        if not candidates:
+            return None
+
+        now = time.time()
+        token = max(candidates, key=lambda t: self._headroom(t, kind, now))
+        if self._headroom(token, kind, now) <= 0:
+            # Every token is drained: queue until the earliest reset if it is
+            # close, and never past the current stats deadline
+            reset = min(self._budgets[t][kind]["reset"] for t in candidates)
+            max_wait = TOKEN_POOL_MAX_WAIT
+            current = deadline.current()
+            if current is not None:
+                max_wait = min(max_wait, current.remaining())
+            if reset - now > max_wait:
+                self.degraded += 1
+                return None
+            self.waits += 1
+            await asyncio.sleep(max(reset - now, 0))
+            token = max(candidates, key=lambda t: self._headroom(t, kind, time.time()))
+
+        # Count the call now; the response headers correct the estimate
+        budget = self._budgets[token][kind]
+        if budget["reset"] and budget["reset"] <= time.time():
+            budget["remaining"] = budget["limit"]
+            budget["reset"] = 0.0
+        budget["remaining"] -= 1
+        return token
+
+    def update(self, token: str, kind: str, response: httpx.Response):
+        """Record the budget GitHub reports in a response."""
+        if token not in self._budgets:
+            return
+        if response.status_code == 401:
+            # Revoked or mistyped token
+            self._disabled.add(token)
+            return
+
+        headers = response.headers
+        kind = headers.get("X-RateLimit-Resource", kind)
+        if kind not in self._budgets[token]:
+            return
+
+        budget = self._budgets[token][kind]
+        if "X-RateLimit-Remaining" in headers:
+            budget["remaining"] = int(headers["X-RateLimit-Remaining"])
+        if "X-RateLimit-Limit" in headers:
+            budget["limit"] = int(headers["X-RateLimit-Limit"])
+        if "X-RateLimit-Reset" in headers:
+            budget["reset"] = float(headers["X-RateLimit-Reset"])
+
+    def update_graphql(self, request: httpx.Request, rate_limit: dict):
+        """Record the rateLimit { cost remaining resetAt } block of a GraphQL reply.
+
+        The caller passes the block from the body it already parsed, so the
+        (possibly large) body is only decoded once.
+        """
+        token = request.headers.get("Authorization", "")[len("token "):]
+        if not rate_limit or token not in self._budgets:
+            return
+        budget = self._budgets[token]["graphql"]
+        budget["remaining"] = rate_limit["remaining"]
+        budget["cost"] = rate_limit["cost"]
+        reset_at = datetime.strptime(rate_limit["resetAt"], "%Y-%m-%dT%H:%M:%SZ")
+        budget["reset"] = reset_at.replace(tzinfo=timezone.utc).timestamp()
+
+    def stats(self) -> dict:
+        """Per-token budget gauges, identified by the token's last four characters."""
+        return {
+            "tokens": [
+                {
+                    "token": "..." + token[-4:],
+                    "disabled": token in self._disabled,
+                    "budgets": self._budgets[token]
+                }
+                for token in self._budgets
+            ],
+            "waits": self.waits,
+            "degraded": self.degraded
+        }
+
+class TokenPoolAuth(httpx.Auth):
+    """httpx auth flow that signs each request with a token from the pool.
+
+    Only response headers are read here, so streamed bodies stay unread;
+    GraphQL callers report the body's rateLimit block via update_graphql.
+    """
+
+    def __init__(self, pool: TokenPool):
+        self.pool = pool
+
+    async def async_auth_flow(self, request: httpx.Request):
+        token = None
+        # An explicit Authorization header (e.g. a caller's own token) wins
+        if "Authorization" not in request.headers:
+            kind = "graphql" if request.url.path == "/graphql" else "core"
+            token = await self.pool.acquire(kind)
+            if token:
+                request.headers["Authorization"] = f"token {token}"
+
+        response = yield request
+
+        if token:
+            self.pool.update(token, kind, response)
+
+# Tokens shared by all upstream calls
+token_pool = TokenPool(_load_tokens())
@@ -0,0 +1,65 @@
+"""Compare the contribution analytics module against the old per-day streak loop.
+
+    python benchmarks/bench_analytics.py --users 1000 --years 5
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import analytics  # noqa: E402
+
+def legacy_max_streak(contribution_days: list) -> int:
+    """The per-day loop get_user_stats used before the analytics module."""
+    max_streak = 0
+    current_streak = 0
+    for day in contribution_days:
+        if day["count"] > 0:
+            current_streak += 1
+            max_streak = max(max_streak, current_streak)
+        else:
+            current_streak = 0
+    return max_streak
+
+def make_history(days: int, seed: int) -> list:
+    rng = random.Random(seed)
+    start = date.today() - timedelta(days=days - 1)
+    return [
+        {"date": (start + timedelta(days=i)).isoformat(), "count": rng.choice((0, 0, 0, 1, 2, 3, 5, 8))}
+        for i in range(days)
+    ]
+
+def bench(label: str, func, histories: list):
+    started = time.perf_counter()
+    for history in histories:
+        func(history)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {elapsed * 1000:9.1f} ms total  {elapsed / len(histories) * 1e6:9.1f} us/user")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+
+    histories = [make_history(args.years * 365, seed) for seed in range(args.users)]
+    packed = [(analytics.to_counts(history), 0) for history in histories]
+    print(f"{args.users} users x {args.years * 365} days, numpy={'yes' if analytics._numpy() else 'no'}")
+
+    bench("legacy loop (max streak only)", legacy_max_streak, histories)
+
+    numpy_module = analytics._numpy()
+    if numpy_module is not None:
+        bench("analytics.summarize (numpy)", analytics.summarize, histories)
+        bench("summarize_counts, packed (numpy)", lambda args: analytics.summarize_counts(*args), packed)
+    analytics.np = None
+    bench("analytics.summarize (pure python)", analytics.summarize, histories)
+    bench("summarize_counts, packed (python)", lambda args: analytics.summarize_counts(*args), packed)
+    analytics.np = numpy_module
+
+if __name__ == "__main__":
+    main()
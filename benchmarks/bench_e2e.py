@@ -0,0 +1,140 @@
+"""End-to-end latency, upstream calls, bytes and memory for /stats and /stats/svg against a fake GitHub.
+
+    python benchmarks/bench_e2e.py --users 200 --repos 60 --latency-ms 80 --concurrency 20
+
+The app runs in-process with its shared HTTP client pointed at
+benchmarks/fake_github.py, so no network or token is needed. Each endpoint
+is hit cold (new users, every upstream call made) and then warm (the same
+users again, served from the caches).
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Read by the app modules at import: keep the contributions store in memory
+os.environ.setdefault("CONTRIB_DB_PATH", ":memory:")
+
+import httpx  # noqa: E402
+from fake_github import FakeGitHub, create_app  # noqa: E402
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+async def run_round(client: httpx.AsyncClient, github: FakeGitHub, path: str, usernames: list, concurrency: int) -> dict:
+    """Request path for every username with `concurrency` requests in flight."""
+    github.reset()
+    latencies = []
+    bytes_out = 0
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(username):
+        nonlocal bytes_out, errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(path, params={"username": username})
+            latencies.append(time.perf_counter() - start)
+            bytes_out += response.num_bytes_downloaded
+            errors += response.status_code != 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(username) for username in usernames))
+    elapsed = time.perf_counter() - start
+    return {
+        "latencies": latencies,
+        "elapsed": elapsed,
+        "bytes_out": bytes_out,
+        "errors": errors,
+        "upstream_calls": dict(github.calls),
+        "upstream_bytes": github.bytes_out
+    }
+
+def report(label: str, result: dict, requests: int):
+    ms = [latency * 1000 for latency in result["latencies"]]
+    calls = result["upstream_calls"]
+    breakdown = ", ".join(f"{kind} {count / requests:.1f}" for kind, count in sorted(calls.items())) or "none"
+    print(
+        f"{label:<18} p50 {percentile(ms, 50):8.1f} ms  p95 {percentile(ms, 95):8.1f} ms  "
+        f"p99 {percentile(ms, 99):8.1f} ms  {requests / result['elapsed']:7.1f} req/s  "
+        f"out {result['bytes_out'] / requests / 1024:6.1f} KiB/req  errors {result['errors']}"
+    )
+    print(
+        f"{'':<18} upstream {sum(calls.values()) / requests:.1f} calls/req ({breakdown}), "
+        f"{result['upstream_bytes'] / requests / 1024:.1f} KiB/req"
+    )
+
+async def main(args):
+    github = FakeGitHub(
+        repos=args.repos,
+        languages=args.languages,
+        density=args.density,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000
+    )
+
+    from app import http_client
+    from app import main as server
+
+    # Every GitHub call the app makes now lands on the fake
+    await http_client.start_client(httpx.ASGITransport(app=create_app(github)))
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=server.app),
+        base_url="http://bench",
+        headers={"Accept-Encoding": "gzip, br"},
+        timeout=None
+    )
+
+    print(
+        f"{args.users} users, {args.repos} repos x {args.languages} languages, density {args.density}, "
+        f"upstream latency {args.latency_ms}±{args.jitter_ms} ms, concurrency {args.concurrency}, "
+        f"{'with' if server.token_pool.has_tokens() else 'without'} token"
+    )
+    for path in ("/stats", "/stats/svg"):
+        usernames = [f"{path.strip('/').replace('/', '-')}-user{i}" for i in range(args.users)]
+        report(f"{path} cold", await run_round(client, github, path, usernames, args.concurrency), args.users)
+        for round_number in range(args.rounds):
+            result = await run_round(client, github, path, usernames, args.concurrency)
+            report(f"{path} warm", result, args.users)
+
+    # Memory is measured in its own pass; tracemalloc slows everything down
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    usernames = [f"memory-user{i}" for i in range(args.users)]
+    await run_round(client, github, "/stats/svg", usernames, args.concurrency)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"memory (cold /stats/svg): peak {(peak - before) / 1024:.0f} KiB, "
+        f"retained {(current - before) / args.users / 1024:.1f} KiB/user (caches)"
+    )
+
+    await client.aclose()
+    await http_client.close_client()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--repos", type=int, default=30, help="repos per user (about 10%% are forks)")
+    parser.add_argument("--languages", type=int, default=3, help="languages per repo")
+    parser.add_argument("--density", type=float, default=0.6, help="share of calendar days with contributions")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="mean upstream latency")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="standard deviation of upstream latency")
+    parser.add_argument("--concurrency", type=int, default=10, help="requests in flight against the app")
+    parser.add_argument("--rounds", type=int, default=1, help="warm rounds after the cold one")
+    parser.add_argument("--no-token", action="store_true", help="run unauthenticated (REST only, no GraphQL)")
+    args = parser.parse_args()
+
+    # The token pool reads these at import
+    if args.no_token:
+        os.environ["GITHUB_TOKEN"] = ""
+        os.environ["GITHUB_TOKENS"] = ""
+    else:
+        os.environ.setdefault("GITHUB_TOKEN", "benchmark-token")
+    asyncio.run(main(args))
@@ -0,0 +1,83 @@
+"""Measure the cold-start import time of the app (what a fresh serverless instance pays before its first request).
+
+    python benchmarks/bench_import.py --runs 10 --budget-ms 400
+
+Each run imports the module in a new interpreter with `python -X importtime`
+and the median is reported, broken down by the modules app.main imports directly
+and by the slowest modules overall. With --budget-ms the script exits with
+status 1 when the median is over budget, so it can gate CI.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def import_times(module: str) -> list:
+    """One run: [(depth, name, self_us, cumulative_us)] for every module imported."""
+    code = f"import sys; sys.path.insert(0, {str(ROOT)!r}); import {module}"
+    # Keep the contribution store off disk so the run measures imports, not file creation
+    env = dict(os.environ, CONTRIB_DB_PATH=":memory:")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main", help="module to import")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, help="fail if the median import time is above this")
+    args = parser.parse_args()
+
+    totals = []
+    direct = {}  # name -> cumulative us per run, for the modules `module` imports itself
+    own = {}  # name -> self us per run
+    for _ in range(args.runs):
+        rows = import_times(args.module)
+        # -X importtime lists a module after its imports, so the target comes last
+        target = next(i for i in range(len(rows) - 1, -1, -1) if rows[i][1] == args.module)
+        target_depth = rows[target][0]
+        totals.append(rows[target][3])
+        # Its own imports are the rows just above it, nested one level deeper
+        start = target
+        while start > 0 and rows[start - 1][0] > target_depth:
+            start -= 1
+        for depth, name, self_us, cumulative_us in rows[start:target + 1]:
+            own.setdefault(name, []).append(self_us)
+            if depth == target_depth + 1:
+                direct.setdefault(name, []).append(cumulative_us)
+
+    median_ms = statistics.median(totals) / 1000
+    print(
+        f"import {args.module}: median {median_ms:.1f} ms, min {min(totals) / 1000:.1f} ms, "
+        f"max {max(totals) / 1000:.1f} ms over {args.runs} runs"
+    )
+
+    print(f"\n{'imported by ' + args.module:<40} {'cumulative':>12}")
+    for name, times in sorted(direct.items(), key=lambda item: -statistics.median(item[1]))[:args.top]:
+        print(f"{name:<40} {statistics.median(times) / 1000:9.1f} ms")
+
+    print(f"\n{'slowest modules':<40} {'self':>12}")
+    for name, times in sorted(own.items(), key=lambda item: -statistics.median(item[1]))[:args.top]:
+        print(f"{name:<40} {statistics.median(times) / 1000:9.1f} ms")
+
+    if args.budget_ms is not None:
+        if median_ms > args.budget_ms:
+            print(f"\nover budget: {median_ms:.1f} ms > {args.budget_ms:.1f} ms")
+            sys.exit(1)
+        print(f"\nwithin budget: {median_ms:.1f} ms <= {args.budget_ms:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""A synthetic, in-process stand-in for the GitHub REST and GraphQL APIs.
+
+Serves the endpoints the app calls (users, repo listings, languages_url and
+the GraphQL queries) as an ASGI app, so benchmarks can plug it into the
+shared client with httpx.ASGITransport and run without touching the network.
+Every user is generated deterministically from their login, with a
+configurable number of repos, languages per repo and calendar density.
+Logins starting with "missing" do not exist.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+import zlib
+from datetime import date, datetime, timedelta
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+
+LANGUAGES = (
+    "Python", "JavaScript", "TypeScript", "Go", "Rust", "Java", "C", "C++", "Ruby", "Shell",
+    "HTML", "CSS", "Kotlin", "Swift", "Dart", "PHP", "Zig", "Elixir", "Haskell", "Lua"
+)
+PER_PAGE = 100
+
+class FakeGitHub:
+    """Fixture generator plus per-kind upstream call, status and byte counters."""
+
+    def __init__(self, repos: int = 30, languages: int = 3, density: float = 0.6,
+                 latency: float = 0.05, jitter: float = 0.01, seed: int = 0):
+        self.repos = repos
+        self.languages = languages
+        self.density = density
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        self.calls = {}
+        self.statuses = {}
+        self.bytes_out = 0
+
+    async def delay(self):
+        if self.latency > 0:
+            await asyncio.sleep(max(0.0, self.rng.gauss(self.latency, self.jitter)))
+
+    def respond(self, kind: str, request: Request, payload, headers: dict = None) -> Response:
+        """JSON response with an ETag, or 304 if the client already has it."""
+        self.calls[kind] = self.calls.get(kind, 0) + 1
+        body = json.dumps(payload).encode("utf-8")
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        headers = dict(headers or {}, ETag=etag)
+        if request.headers.get("If-None-Match") == etag:
+            response = Response(status_code=304, headers=headers)
+        else:
+            response = Response(content=body, media_type="application/json", headers=headers)
+        self.statuses[response.status_code] = self.statuses.get(response.status_code, 0) + 1
+        self.bytes_out += len(response.body)
+        return response
+
+    def not_found(self, kind: str) -> Response:
+        self.calls[kind] = self.calls.get(kind, 0) + 1
+        self.statuses[404] = self.statuses.get(404, 0) + 1
+        return Response(content=b'{"message": "Not Found"}', status_code=404, media_type="application/json")
+
+    # Fixtures
+
+    @staticmethod
+    def _seed(*parts) -> int:
+        return zlib.crc32(":".join(map(str, parts)).encode())
+
+    def profile(self, login: str) -> dict:
+        seed = self._seed(login)
+        return {
+            "login": login,
+            "name": login.title(),
+            "bio": None,
+            "location": "Benchmark City",
+            "created_at": "2015-03-14T09:26:53Z",
+            "avatar_url": f"https://avatars.example/{login}",
+            "public_repos": self.repos,
+            "followers": seed % 500,
+            "following": seed % 50
+        }
+
+    def repo_list(self, login: str) -> list:
+        return [
+            {
+                "name": f"repo-{i}",
+                "full_name": f"{login}/repo-{i}",
+                "fork": self._seed(login, i) % 10 == 0,
+                "languages_url": f"https://api.github.com/repos/{login}/repo-{i}/languages",
+                "pushed_at": "2026-01-01T00:00:00Z"
+            }
+            for i in range(self.repos)
+        ]
+
+    def repo_languages(self, login: str, repo: str) -> dict:
+        rng = random.Random(self._seed(login, repo))
+        return {name: rng.randint(1000, 200000) for name in rng.sample(LANGUAGES, self.languages)}
+
+    def calendar(self, login: str, start: date, end: date) -> dict:
+        threshold = int(self.density * 100)
+        days = []
+        day = start
+        while day <= end:
+            seed = self._seed(login, day)
+            days.append({"date": day.isoformat(), "contributionCount": seed % 9 + 1 if seed % 100 < threshold else 0})
+            day += timedelta(days=1)
+        weeks = [{"contributionDays": days[i:i + 7]} for i in range(0, len(days), 7)]
+        return {"contributionCalendar": {"totalContributions": sum(d["contributionCount"] for d in days), "weeks": weeks}}
+
+    def graphql_repositories(self, login: str, cursor, per_repo: int) -> dict:
+        owned = [repo for repo in self.repo_list(login) if not repo["fork"]]
+        offset = int(cursor or 0)
+        page = owned[offset:offset + PER_PAGE]
+        nodes = []
+        for repo in page:
+            languages = sorted(self.repo_languages(login, repo["name"]).items(), key=lambda item: -item[1])
+            nodes.append({"languages": {"edges": [
+                {"size": size, "node": {"name": name, "color": None}} for name, size in languages[:per_repo]
+            ]}})
+        more = offset + PER_PAGE < len(owned)
+        return {"pageInfo": {"hasNextPage": more, "endCursor": str(offset + PER_PAGE)}, "nodes": nodes}
+
+    @staticmethod
+    def _over_a_year(start: datetime, end: datetime) -> bool:
+        """GitHub rejects a contributionsCollection spanning more than one year."""
+        try:
+            limit = start.replace(year=start.year + 1)
+        except ValueError:
+            # Feb 29
+            limit = start.replace(year=start.year + 1, month=3, day=1)
+        return end > limit
+
+    def graphql(self, query: str, variables: dict) -> dict:
+        """The response body: {"data": ...} plus "errors" when a field fails."""
+        data = {"rateLimit": {"cost": 1, "remaining": 4999, "resetAt": "2099-01-01T00:00:00Z"}}
+        errors = []
+
+        for alias, variable in re.findall(r"(u\d+): user\(login: \$(login\d+)\)", query):
+            login = variables[variable]
+            if login.startswith("missing"):
+                data[alias] = None
+                continue
+            profile = self.profile(login)
+            data[alias] = {
+                "login": login, "name": profile["name"], "bio": None, "location": profile["location"],
+                "createdAt": profile["created_at"], "avatarUrl": profile["avatar_url"],
+                "followers": {"totalCount": profile["followers"]},
+                "following": {"totalCount": profile["following"]},
+                "repositories": {"totalCount": self.repos}
+            }
+
+        if "user(login: $username)" in query:
+            login = variables["username"]
+            if login.startswith("missing"):
+                data["user"] = None
+                return {"data": data}
+            user = {}
+            for alias, start, end in re.findall(r"(\w+: )?contributionsCollection\(from: \$(\w+), to: \$(\w+)\)", query):
+                field = alias[:-2] if alias else "contributionsCollection"
+                start = datetime.strptime(variables[start], "%Y-%m-%dT%H:%M:%SZ")
+                end = datetime.strptime(variables[end], "%Y-%m-%dT%H:%M:%SZ")
+                if self._over_a_year(start, end):
+                    errors.append({
+                        "message": "The total time spanned by 'from' and 'to' must not exceed 1 year",
+                        "path": ["user", field]
+                    })
+                    # contributionsCollection is non-null, so the error nulls the whole user
+                    user = None
+                    break
+                user[field] = self.calendar(login, start.date(), end.date())
+            if user is not None and "repositories(first:" in query:
+                user["repositories"] = self.graphql_repositories(login, variables.get("cursor"), variables.get("languages", 10))
+            data["user"] = user
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+def create_app(github: FakeGitHub) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/users/{login}")
+    async def user(login: str, request: Request):
+        await github.delay()
+        if login.startswith("missing"):
+            return github.not_found("user")
+        return github.respond("user", request, github.profile(login))
+
+    @app.get("/users/{login}/repos")
+    async def repos(login: str, request: Request, page: int = 1, per_page: int = 30):
+        await github.delay()
+        repos = github.repo_list(login)
+        last = max(1, -(-len(repos) // per_page))
+        headers = {}
+        if page < last:
+            base = f"https://api.github.com/users/{login}/repos?per_page={per_page}"
+            headers["Link"] = f'<{base}&page={page + 1}>; rel="next", <{base}&page={last}>; rel="last"'
+        return github.respond("repos", request, repos[(page - 1) * per_page:page * per_page], headers)
+
+    @app.get("/repos/{login}/{repo}/languages")
+    async def languages(login: str, repo: str, request: Request):
+        await github.delay()
+        return github.respond("languages", request, github.repo_languages(login, repo))
+
+    @app.post("/graphql")
+    async def graphql(request: Request):
+        await github.delay()
+        body = await request.json()
+        return github.respond("graphql", request, github.graphql(body["query"], body.get("variables") or {}))
+
+    return app
@@ -0,0 +1,25 @@
+from datetime import date, timedelta
+from app import analytics
+
+def _days(start: date, counts: list) -> list:
+    return [{"date": (start + timedelta(days=i)).isoformat(), "count": count} for i, count in enumerate(counts)]
+
+def test_summarize_runs_does_not_count_across_a_missing_stretch():
+    # A year in between was never stored
+    before = _days(date(2022, 12, 29), [1, 1, 1])  # Thu, Fri, Sat
+    after = _days(date(2024, 1, 1), [1, 1, 0, 1])  # Mon, Tue, Wed, Thu
+
+    summary = analytics.summarize_runs(before + after)
+
+    assert summary["total"] == 6
+    assert summary["active_days"] == 6
+    assert summary["max_streak"] == 3
+    assert summary["longest_gap"] == 1
+    assert summary["current_streak"] == 1
+    assert summary["weekday_distribution"] == {
+        "Mon": 1, "Tue": 1, "Wed": 0, "Thu": 2, "Fri": 1, "Sat": 1, "Sun": 0
+    }
+
+def test_summarize_runs_matches_summarize_for_consecutive_days():
+    days = _days(date(2024, 3, 1), [0, 2, 3, 0, 0, 1])
+    assert analytics.summarize_runs(days) == analytics.summarize(days)
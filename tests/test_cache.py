@@ -0,0 +1,10 @@
+from app.cache import TTLCache
+
+def test_oversized_value_does_not_flush_the_cache():
+    cache = TTLCache(ttl=60, stale_ttl=60, max_entries=10, max_bytes=100)
+    cache.set("a", "x" * 50)
+    cache.set("b", "y" * 200)
+
+    assert cache.get("a") == ("x" * 50, True)
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 0
@@ -0,0 +1,65 @@
+import asyncio
+import json
+import httpx
+from app import graphql, tokens
+
+RATE_LIMIT = {"cost": 3, "remaining": 4321, "resetAt": "2099-01-01T00:00:00Z"}
+
+class ChunkedStream(httpx.AsyncByteStream):
+    """A body that is only available by iterating it, like a real network response."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def __aiter__(self):
+        for i in range(0, len(self.body), 16):
+            yield self.body[i:i + 16]
+
+class StreamingTransport(httpx.AsyncBaseTransport):
+    """Answers every request with a streamed body and records what was sent."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/graphql":
+            body = {"data": {"rateLimit": RATE_LIMIT, "user": {"login": "octocat"}}}
+            headers = {"X-RateLimit-Resource": "graphql"}
+        else:
+            body = {"login": "octocat"}
+            headers = {"X-RateLimit-Resource": "core", "X-RateLimit-Remaining": "4000"}
+        return httpx.Response(200, headers=headers, stream=ChunkedStream(json.dumps(body).encode()))
+
+def _client(pool: tokens.TokenPool, transport: StreamingTransport) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=transport, auth=tokens.TokenPoolAuth(pool))
+
+def test_graphql_through_pool_reads_rate_limit_from_streamed_body(monkeypatch):
+    pool = tokens.TokenPool(["ghp_test"])
+    monkeypatch.setattr(graphql, "token_pool", pool)
+    transport = StreamingTransport()
+
+    async def run():
+        async with _client(pool, transport) as client:
+            return await graphql.post_graphql(client, "query { rateLimit { cost } }", {}, {})
+
+    data = asyncio.run(run())
+
+    assert data["user"] == {"login": "octocat"}
+    assert transport.requests[0].headers["Authorization"] == "token ghp_test"
+    budget = pool.stats()["tokens"][0]["budgets"]["graphql"]
+    assert budget["remaining"] == RATE_LIMIT["remaining"]
+    assert budget["cost"] == RATE_LIMIT["cost"]
+
+def test_streamed_rest_response_is_left_unread():
+    pool = tokens.TokenPool(["ghp_test"])
+    transport = StreamingTransport()
+
+    async def run():
+        async with _client(pool, transport) as client:
+            async with client.stream("GET", "https://api.github.com/users/octocat") as response:
+                assert not response.is_stream_consumed
+                return json.loads(await response.aread())
+
+    assert asyncio.run(run()) == {"login": "octocat"}
+    assert pool.stats()["tokens"][0]["budgets"]["core"]["remaining"] == 4000